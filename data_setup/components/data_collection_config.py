@@ -4,34 +4,314 @@ Focused solely on data collection from APIs - no database insertion
 """
 
 import yfinance as yf
+import numpy as np
 import pandas as pd
+import hashlib
+import json
+import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+import tempfile
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 import logging
 
+from data_setup.utils.kernels import NUMBA_AVAILABLE, realized_vol_from_prices, rolling_std
+
+try:
+    import bottleneck as bn  # Optional: C rolling-window kernels
+except ImportError:
+    bn = None
+
+try:
+    import requests_cache  # Optional: on-disk HTTP response cache
+except ImportError:
+    requests_cache = None
+
+try:
+    import pyarrow  # Optional: enables the Parquet price cache
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+try:
+    from orjson import loads as json_loads  # Optional: 2-5x faster JSON decoding
+except ImportError:
+    json_loads = json.loads
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Maximum number of tickers Yahoo Finance reliably serves in one download request
+YF_BATCH_SIZE = 20
+
+# yfinance price column -> daily_prices column
+YF_PRICE_COLUMNS = {
+    'Open': 'open_price',
+    'High': 'high_price',
+    'Low': 'low_price',
+    'Close': 'close_price',
+    'Volume': 'volume',
+    'Dividends': 'dividend_amount',
+    'Stock Splits': 'split_coefficient'
+}
+
+# Alpha Vantage free-tier request budget
+AV_CALLS_PER_MINUTE = 5
+
+# (connect, read) timeout in seconds for Alpha Vantage / FRED requests
+REQUEST_TIMEOUT = (3, 30)
+
+# Keep-alive connection pool and retry policy for the shared HTTP session
+HTTP_POOL_SIZE = 16
+HTTP_RETRY = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
+
+# On-disk cache for Alpha Vantage / FRED responses (requires requests_cache)
+HTTP_CACHE_NAME = '.http_cache'
+HTTP_CACHE_EXPIRE = timedelta(hours=6)
+
+# Typed layout for parsed FRED observations
+FRED_OBSERVATION_DTYPE = np.dtype([('date', 'datetime64[D]'), ('value', 'f8')])
+
+# On-disk Parquet cache for standardized yfinance price frames (requires pyarrow)
+PRICE_CACHE_DIR = Path('.price_cache')
+
+# On-disk JSON cache for yfinance Ticker.info payloads
+INFO_CACHE_DIR = Path('.info_cache')
+
+
+def _is_cacheable(response) -> bool:
+    """Keep Alpha Vantage rate-limit notes and error payloads (served with HTTP 200) out of the cache"""
+    try:
+        data = json_loads(response.content)
+    except ValueError:
+        return False
+    return not any(key in data for key in ('Note', 'Information', 'Error Message'))
+
+
+def _daily_cache_path(directory: Path, suffix: str, *key_parts: str) -> Path:
+    """Cache file for a request; today's date is part of the key so entries expire daily"""
+    key = '|'.join(key_parts + (datetime.now().strftime('%Y-%m-%d'),))
+    return directory / f"{hashlib.md5(key.encode()).hexdigest()}{suffix}"
+
+
+def _price_cache_path(*key_parts: str) -> Path:
+    """Parquet cache file for a price request (periods are relative to today)"""
+    return _daily_cache_path(PRICE_CACHE_DIR, '.parquet', *key_parts)
+
+
+def _read_price_cache(path: Path) -> Optional[pd.DataFrame]:
+    """Cached price frame, or None on a miss; unreadable entries (e.g. truncated by a killed run) are deleted"""
+    if not path.exists():
+        return None
+    try:
+        return pd.read_parquet(path)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Discarding unreadable price cache {path}: {e}")
+        path.unlink(missing_ok=True)
+        return None
+
+
+def _write_price_cache(path: Path, frame: pd.DataFrame):
+    """Write a price frame to the cache atomically (temp file + os.replace); failures are only logged"""
+    tmp_path = None
+    try:
+        path.parent.mkdir(exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        os.close(fd)
+        frame.to_parquet(tmp_path, compression='zstd')
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logger.warning(f"Could not write price cache {path}: {e}")
+        if tmp_path is not None:
+            Path(tmp_path).unlink(missing_ok=True)
+
+
+def _annualized_rolling_std(returns: np.ndarray, window: int) -> np.ndarray:
+    """Annualized rolling std of a 1-D or (dates x symbols) returns array using the fastest available kernel"""
+    values = returns.reshape(len(returns), -1)
+    if NUMBA_AVAILABLE:
+        std = rolling_std(values, window)
+    elif bn is not None:
+        std = bn.move_std(values, window=window, axis=0, ddof=1)
+    else:
+        std = pd.DataFrame(values).rolling(window=window).std().to_numpy()
+    return (std * (252**0.5)).reshape(returns.shape)
+
+
+# Recommended symbols for comprehensive financial markets analysis: (symbol, asset_type)
+RECOMMENDED_SYMBOLS: Tuple[Tuple[str, str], ...] = (
+    # Major Market Indices
+    ('SPY', 'ETF'),     # S&P 500
+    ('QQQ', 'ETF'),     # NASDAQ 100
+    ('IWM', 'ETF'),     # Russell 2000
+    ('VTI', 'ETF'),     # Total Stock Market
+    
+    # Sector ETFs
+    ('XLK', 'ETF'),     # Technology
+    ('XLF', 'ETF'),     # Financial
+    ('XLE', 'ETF'),     # Energy
+    ('XLV', 'ETF'),     # Healthcare
+    ('XLI', 'ETF'),     # Industrial
+    ('XLY', 'ETF'),     # Consumer Discretionary
+    ('XLP', 'ETF'),     # Consumer Staples
+    ('XLU', 'ETF'),     # Utilities
+    ('XLRE', 'ETF'),    # Real Estate
+    ('XLB', 'ETF'),     # Materials
+    
+    # Blue Chip Stocks
+    ('AAPL', 'Stock'),  # Apple
+    ('MSFT', 'Stock'),  # Microsoft  
+    ('GOOGL', 'Stock'), # Alphabet
+    ('AMZN', 'Stock'),  # Amazon
+    ('TSLA', 'Stock'),  # Tesla
+    ('NVDA', 'Stock'),  # NVIDIA
+    ('JPM', 'Stock'),   # JPMorgan Chase
+    ('JNJ', 'Stock'),   # Johnson & Johnson
+    ('V', 'Stock'),     # Visa
+    ('PG', 'Stock'),    # Procter & Gamble
+    
+    # Bonds & Commodities
+    ('TLT', 'ETF'),     # 20+ Year Treasury Bonds
+    ('SHY', 'ETF'),     # 1-3 Year Treasury Bonds
+    ('GLD', 'ETF'),     # Gold
+    ('VNQ', 'ETF'),     # REITs
+)
+
+# Recommended FRED economic indicators: series_id -> metadata
+FRED_INDICATORS: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    'FEDFUNDS': MappingProxyType({
+        'name': 'Federal Funds Rate', 
+        'unit': 'Percent', 
+        'frequency': 'Monthly',
+        'source': 'FRED'
+    }),
+    'UNRATE': MappingProxyType({
+        'name': 'Unemployment Rate', 
+        'unit': 'Percent', 
+        'frequency': 'Monthly',
+        'source': 'FRED'
+    }), 
+    'CPIAUCSL': MappingProxyType({
+        'name': 'Consumer Price Index for All Urban Consumers', 
+        'unit': 'Index 1982-84=100', 
+        'frequency': 'Monthly',
+        'source': 'FRED'
+    }),
+    'GDP': MappingProxyType({
+        'name': 'Gross Domestic Product', 
+        'unit': 'Billions of Dollars', 
+        'frequency': 'Quarterly',
+        'source': 'FRED'
+    }),
+    'GS10': MappingProxyType({
+        'name': '10-Year Treasury Constant Maturity Rate', 
+        'unit': 'Percent', 
+        'frequency': 'Daily',
+        'source': 'FRED'
+    }),
+    'DGS2': MappingProxyType({
+        'name': '2-Year Treasury Constant Maturity Rate', 
+        'unit': 'Percent', 
+        'frequency': 'Daily',
+        'source': 'FRED'
+    }),
+    'VIXCLS': MappingProxyType({
+        'name': 'CBOE Volatility Index: VIX', 
+        'unit': 'Index', 
+        'frequency': 'Daily',
+        'source': 'FRED'
+    }),
+    'UMCSENT': MappingProxyType({
+        'name': 'University of Michigan: Consumer Sentiment', 
+        'unit': 'Index 1966:Q1=100', 
+        'frequency': 'Monthly',
+        'source': 'FRED'
+    })
+})
+
+
+class RateLimiter:
+    """
+    Thread-safe sliding-window rate limiter allowing at most `calls` per `period` seconds
+    """
+    
+    def __init__(self, calls: int, period: float = 60.0):
+        self.calls = calls
+        self.period = period
+        self._timestamps = deque()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until another call is allowed within the rate limit"""
+        with self._lock:
+            while True:
+                now = time.monotonic()
+                while self._timestamps and now - self._timestamps[0] >= self.period:
+                    self._timestamps.popleft()
+                
+                if len(self._timestamps) < self.calls:
+                    self._timestamps.append(now)
+                    return
+                
+                time.sleep(self.period - (now - self._timestamps[0]))
+
+
 class FinancialDataCollector:
     """
     Data collector for financial markets - collection only, no database operations
     """
     
-    def __init__(self, alpha_vantage_key: str = None, fred_api_key: str = None):
+    def __init__(self, alpha_vantage_key: str = None, fred_api_key: str = None, use_cache: bool = True,
+                 av_calls_per_minute: int = AV_CALLS_PER_MINUTE):
         """
         Initialize the data collector
         
         Args:
             alpha_vantage_key (str): Alpha Vantage API key for fundamental data
             fred_api_key (str): FRED API key for economic data
+            use_cache (bool): Cache API responses (requests_cache), price frames (pyarrow) and yfinance info on disk
+            av_calls_per_minute (int): Alpha Vantage rate limit enforced on every OVERVIEW request (None/0 disables)
         """
         self.alpha_vantage_key = alpha_vantage_key
         self.fred_api_key = fred_api_key
         self.alpha_vantage_url = "https://www.alphavantage.co/query"
         self.fred_url = "https://api.stlouisfed.org/fred/series/observations"
+        self.use_cache = use_cache
+        
+        # Sliding-window limiter: only waits for whatever part of the window has not already
+        # elapsed, so time spent on other work between calls counts towards the pacing
+        self.av_calls_per_minute = av_calls_per_minute
+        self._av_limiter = RateLimiter(av_calls_per_minute, period=60.0) if av_calls_per_minute else None
+        
+        # Shared session so TCP/TLS connections are reused across calls and threads
+        if use_cache and requests_cache is not None:
+            self._session = requests_cache.CachedSession(
+                HTTP_CACHE_NAME, backend='sqlite', expire_after=HTTP_CACHE_EXPIRE, filter_fn=_is_cacheable
+            )
+        else:
+            self._session = requests.Session()
+        
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=HTTP_RETRY)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        
+        # Ask for compressed JSON using every encoding urllib3 can decode here (gzip/deflate, plus br/zstd
+        # when brotli/zstandard are installed); responses are decompressed transparently
+        self._session.headers.update({'Accept-Encoding': ACCEPT_ENCODING, 'Accept': 'application/json'})
+    
+    def close(self):
+        """Close the shared HTTP session's pooled connections"""
+        self._session.close()
         
     def get_asset_overview_alpha_vantage(self, symbol: str) -> Optional[Dict]:
         """
@@ -47,29 +327,54 @@ class FinancialDataCollector:
             logger.warning("Alpha Vantage API key not provided, skipping OVERVIEW data")
             return None
             
-        params = {
-            'function': 'OVERVIEW',
-            'symbol': symbol,
-            'apikey': self.alpha_vantage_key
-        }
-        
         try:
-            response = requests.get(self.alpha_vantage_url, params=params)
-            response.raise_for_status()
-            data = response.json()
+            params = self._alpha_vantage_params(symbol)
             
-            # Check if we got valid data
-            if 'Symbol' not in data or 'Note' in data or 'Error Message' in data:
-                logger.warning(f"Invalid/limited data for {symbol}: {data.get('Note', data.get('Error Message', 'Unknown error'))}")
-                return None
-                
-            logger.info(f"Successfully collected overview data for {symbol}")
-            return data
+            # Cached responses cost nothing against the API quota, so only live requests wait
+            if self._av_limiter and not self._is_cached(self.alpha_vantage_url, params):
+                self._av_limiter.acquire()
+            
+            response = self._session.get(self.alpha_vantage_url, params=params, timeout=REQUEST_TIMEOUT)
+            response.raise_for_status()
+            return self._parse_overview(symbol, json_loads(response.content))
             
         except Exception as e:
             logger.error(f"Error fetching overview for {symbol}: {e}")
             return None
     
+    @property
+    def http_cache_enabled(self) -> bool:
+        """Whether requests go through the requests_cache HTTP cache"""
+        return getattr(self._session, 'cache', None) is not None
+    
+    def _is_cached(self, url: str, params: Dict) -> bool:
+        """Whether a GET request would be answered by a fresh entry in the HTTP cache"""
+        if not self.http_cache_enabled:
+            return False
+        
+        cache = self._session.cache
+        request = self._session.prepare_request(requests.Request('GET', url, params=params))
+        response = cache.get_response(cache.create_key(request))
+        return response is not None and not response.is_expired
+    
+    def _alpha_vantage_params(self, symbol: str) -> Dict:
+        """Query parameters for an Alpha Vantage OVERVIEW request"""
+        return {
+            'function': 'OVERVIEW',
+            'symbol': symbol,
+            'apikey': self.alpha_vantage_key
+        }
+    
+    def _parse_overview(self, symbol: str, data: Dict) -> Optional[Dict]:
+        """Validate an Alpha Vantage OVERVIEW payload"""
+        # Check if we got valid data
+        if 'Symbol' not in data or 'Note' in data or 'Error Message' in data:
+            logger.warning(f"Invalid/limited data for {symbol}: {data.get('Note', data.get('Error Message', 'Unknown error'))}")
+            return None
+            
+        logger.info(f"Successfully collected overview data for {symbol}")
+        return data
+    
     def get_asset_info_yfinance(self, symbol: str) -> Dict:
         """
         Get basic asset information from Yahoo Finance using yfinance
@@ -80,9 +385,24 @@ class FinancialDataCollector:
         Returns:
             Dict: Asset information (empty dict if error)
         """
+        cache_path = _daily_cache_path(INFO_CACHE_DIR, '.json', symbol) if self.use_cache else None
+        if cache_path and cache_path.exists():
+            try:
+                info = json_loads(cache_path.read_bytes())
+                logger.info(f"Loaded cached yfinance info for {symbol}")
+                return info
+            except (OSError, ValueError) as e:
+                # Truncated or corrupt entry (e.g. an interrupted write): drop it and fetch live
+                logger.warning(f"Discarding unreadable yfinance info cache for {symbol}: {e}")
+                cache_path.unlink(missing_ok=True)
+        
         try:
             ticker = yf.Ticker(symbol)
             info = ticker.info
+            if cache_path and info:
+                cache_path.parent.mkdir(exist_ok=True)
+                cache_path.write_text(json.dumps(info, default=str))
+            
             logger.info(f"Successfully collected yfinance info for {symbol}")
             return info
         except Exception as e:
@@ -100,6 +420,12 @@ class FinancialDataCollector:
         Returns:
             pd.DataFrame or None: Historical price data
         """
+        cache_path = _price_cache_path(symbol, period) if self.use_cache and PARQUET_AVAILABLE else None
+        hist = _read_price_cache(cache_path) if cache_path else None
+        if hist is not None:
+            logger.info(f"Loaded {len(hist)} cached price records for {symbol}")
+            return hist
+        
         try:
             ticker = yf.Ticker(symbol)
             hist = ticker.history(period=period)
@@ -107,28 +433,10 @@ class FinancialDataCollector:
             if hist.empty:
                 logger.warning(f"No price data found for {symbol}")
                 return None
-                
-            # Reset index to get date as a column
-            hist.reset_index(inplace=True)
-            
-            # Standardize column names for database insertion
-            hist.rename(columns={
-                'Date': 'date',
-                'Open': 'open_price',
-                'High': 'high_price',
-                'Low': 'low_price',
-                'Close': 'close_price',
-                'Volume': 'volume',
-                'Dividends': 'dividend_amount',
-                'Stock Splits': 'split_coefficient'
-            }, inplace=True)
             
-            # Add symbol column
-            hist['symbol'] = symbol
-            
-            # Add adjusted_close if not present (use close_price as fallback)
-            if 'adjusted_close' not in hist.columns:
-                hist['adjusted_close'] = hist['close_price']
+            hist = self._standardize_price_data(hist, symbol)
+            if cache_path:
+                _write_price_cache(cache_path, hist)
             
             logger.info(f"Successfully collected {len(hist)} price records for {symbol}")
             return hist
@@ -137,6 +445,82 @@ class FinancialDataCollector:
             logger.error(f"Error fetching price data for {symbol}: {e}")
             return None
     
+    def get_price_data_yfinance_batch(self, symbols: List[str], period: str = "2y") -> Dict[str, Optional[pd.DataFrame]]:
+        """
+        Get historical price data for several symbols with a single yf.download request
+        
+        Symbols with a same-day Parquet cache entry are served from it; only the misses
+        are downloaded (and then cached), so a re-run makes no price request at all.
+        
+        Args:
+            symbols (List[str]): Stock symbols (Yahoo handles up to ~20 per request)
+            period (str): Time period for data (1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max)
+            
+        Returns:
+            Dict: Price data keyed by symbol (None for symbols with no data)
+        """
+        results = {symbol: None for symbol in symbols}
+        cache_paths = {}
+        if self.use_cache and PARQUET_AVAILABLE:
+            cache_paths = {symbol: _price_cache_path(symbol, period) for symbol in symbols}
+        
+        missing = []
+        for symbol in symbols:
+            hist = _read_price_cache(cache_paths[symbol]) if cache_paths else None
+            if hist is None:
+                missing.append(symbol)
+            else:
+                results[symbol] = hist
+                logger.info(f"Loaded {len(hist)} cached price records for {symbol}")
+        
+        if not missing:
+            return results
+        
+        try:
+            data = yf.download(missing, period=period, group_by='ticker', actions=True,
+                               threads=True, progress=False)
+        except Exception as e:
+            logger.error(f"Error fetching batch price data for {missing}: {e}")
+            return results
+        
+        if data is None or data.empty:
+            logger.warning(f"No price data found for {missing}")
+            return results
+        
+        downloaded = set(data.columns.get_level_values(0))
+        for symbol in missing:
+            if symbol not in downloaded:
+                logger.warning(f"No price data found for {symbol}")
+                continue
+            
+            # Dates are aligned across tickers, so drop rows this symbol didn't trade
+            hist = data[symbol].dropna(how='all')
+            if hist.empty:
+                logger.warning(f"No price data found for {symbol}")
+                continue
+            
+            results[symbol] = self._standardize_price_data(hist, symbol)
+            if cache_paths:
+                _write_price_cache(cache_paths[symbol], results[symbol])
+            logger.info(f"Successfully collected {len(hist)} price records for {symbol}")
+        
+        return results
+    
+    def _standardize_price_data(self, hist: pd.DataFrame, symbol: str) -> pd.DataFrame:
+        """Standardize a yfinance price frame (Date index, OHLCV columns) for database insertion"""
+        # Build the output in a single constructor call instead of reset_index/rename/assign passes
+        data = {'date': hist.index}
+        for source, target in YF_PRICE_COLUMNS.items():
+            if source in hist.columns:
+                data[target] = hist[source].to_numpy()
+        
+        data['symbol'] = np.full(len(hist), symbol, dtype=object)
+        
+        # yfinance prices are already adjusted, so close_price doubles as adjusted_close
+        data['adjusted_close'] = data['close_price']
+        
+        return pd.DataFrame(data, copy=False)
+    
     def get_fred_economic_data(self, series_id: str, start_date: str = None) -> Optional[pd.DataFrame]:
         """
         Get economic data from FRED (Federal Reserve Economic Data)
@@ -152,38 +536,43 @@ class FinancialDataCollector:
             logger.warning("FRED API key not provided, skipping economic data")
             return None
             
+        try:
+            response = self._session.get(self.fred_url, params=self._fred_params(series_id, start_date),
+                                         timeout=REQUEST_TIMEOUT)
+            response.raise_for_status()
+            return self._parse_fred_observations(series_id, json_loads(response.content))
+            
+        except Exception as e:
+            logger.error(f"Error fetching FRED data for {series_id}: {e}")
+            return None
+    
+    def _fred_params(self, series_id: str, start_date: str = None) -> Dict:
+        """Query parameters for a FRED series observations request"""
         if not start_date:
             start_date = (datetime.now() - timedelta(days=730)).strftime('%Y-%m-%d')
         
-        params = {
+        return {
             'series_id': series_id,
             'api_key': self.fred_api_key,
             'file_type': 'json',
             'observation_start': start_date
         }
-        
-        try:
-            response = requests.get(self.fred_url, params=params)
-            response.raise_for_status()
-            data = response.json()
-            
-            if 'observations' not in data:
-                logger.warning(f"No observations found for {series_id}")
-                return None
-            
-            df = pd.DataFrame(data['observations'])
-            df['date'] = pd.to_datetime(df['date'])
-            df['value'] = pd.to_numeric(df['value'], errors='coerce')
-            df['series_id'] = series_id
-            
-            # Clean up and return
-            result = df[['date', 'series_id', 'value']].dropna()
-            logger.info(f"Successfully collected {len(result)} records for {series_id}")
-            return result
-            
-        except Exception as e:
-            logger.error(f"Error fetching FRED data for {series_id}: {e}")
+    
+    def _parse_fred_observations(self, series_id: str, data: Dict) -> Optional[pd.DataFrame]:
+        """Convert a FRED observations payload into a (date, series_id, value) DataFrame"""
+        if 'observations' not in data:
+            logger.warning(f"No observations found for {series_id}")
             return None
+        
+        # Parse straight into a typed (date, value) record array, skipping FRED's '.' missing values
+        result = pd.DataFrame(np.fromiter(
+            ((obs['date'], float(obs['value'])) for obs in data['observations'] if obs['value'] != '.'),
+            dtype=FRED_OBSERVATION_DTYPE
+        ))
+        result.insert(1, 'series_id', series_id)
+        
+        logger.info(f"Successfully collected {len(result)} records for {series_id}")
+        return result
     
     def get_vix_data(self, symbol: str = "^VIX", period: str = "1y") -> Optional[pd.DataFrame]:
         """
@@ -227,23 +616,28 @@ class FinancialDataCollector:
             pd.DataFrame: Volatility data
         """
         try:
-            # Calculate returns
-            price_data = price_data.copy()
-            price_data['returns'] = price_data['close_price'].pct_change()
-            
-            # Calculate rolling volatility (annualized)
-            price_data[f'volatility_{window}d'] = (
-                price_data['returns'].rolling(window=window).std() * (252**0.5)
-            )
-            
-            # Prepare volatility DataFrame
-            volatility_df = price_data[['symbol', 'date', f'volatility_{window}d']].copy()
-            volatility_df = volatility_df.rename(columns={f'volatility_{window}d': 'volatility_value'})
-            volatility_df['volatility_type'] = 'Realized'
-            volatility_df['volatility_period'] = window
-            
-            # Remove NaN values
-            volatility_df = volatility_df.dropna()
+            # Work on NumPy views so the input frame is never copied or mutated
+            close = price_data['close_price'].to_numpy(dtype=np.float32)
+            
+            # Calculate returns and rolling volatility (annualized)
+            if NUMBA_AVAILABLE:
+                # Returns, rolling std and annualization fused into a single compiled pass
+                volatility = realized_vol_from_prices(close, window)
+            else:
+                returns = np.empty_like(close)
+                returns[:1] = np.nan
+                returns[1:] = close[1:] / close[:-1] - 1
+                volatility = _annualized_rolling_std(returns, window)
+            
+            # Prepare volatility DataFrame from the valid (non-NaN) rows only
+            mask = ~np.isnan(volatility)
+            volatility_df = pd.DataFrame({
+                'symbol': price_data['symbol'].to_numpy()[mask],
+                'date': price_data['date'].to_numpy()[mask],
+                'volatility_value': volatility[mask],
+                'volatility_type': 'Realized',
+                'volatility_period': window
+            })
             
             logger.info(f"Calculated realized volatility: {len(volatility_df)} records")
             return volatility_df
@@ -252,150 +646,84 @@ class FinancialDataCollector:
             logger.error(f"Error calculating realized volatility: {e}")
             return pd.DataFrame()
     
-    def batch_collect_with_delay(self, symbols: List[str], collection_func, delay: float = 12.0, **kwargs):
+    def batch_collect_with_delay(self, symbols: List[str], collection_func, delay: float = 12.0,
+                                 max_workers: int = 8, calls_per_minute: int = None, **kwargs):
         """
-        Collect data for multiple symbols with rate limiting
+        Collect data for multiple symbols concurrently with rate limiting
         
         Args:
             symbols (List[str]): List of symbols to collect
             collection_func: Function to call for each symbol
-            delay (float): Seconds between API calls (Alpha Vantage free: 25 calls/day = 12 sec)
+            delay (float): Minimum seconds between API calls (Alpha Vantage free: 25 calls/day = 12 sec)
+            max_workers (int): Number of concurrent requests in flight
+            calls_per_minute (int): Rate limit to respect instead of delay (e.g. 5 for Alpha Vantage, 120 for FRED)
             **kwargs: Additional arguments for collection function
             
         Returns:
             Dict: Results keyed by symbol
         """
-        results = {}
+        results = {symbol: None for symbol in symbols}
         total = len(symbols)
         
-        for i, symbol in enumerate(symbols):
-            logger.info(f"Collecting data for {symbol} ({i+1}/{total})...")
-            
-            try:
-                result = collection_func(symbol, **kwargs)
-                results[symbol] = result
+        # Multi-symbol yfinance downloads: one request per chunk, no rate limiting needed
+        if collection_func == self.get_price_data_yfinance_batch:
+            for start in range(0, total, YF_BATCH_SIZE):
+                chunk = symbols[start:start + YF_BATCH_SIZE]
+                logger.info(f"Collecting data for {len(chunk)} symbols ({start + len(chunk)}/{total})...")
+                results.update(collection_func(chunk, **kwargs))
+        else:
+            if calls_per_minute:
+                limiter = RateLimiter(calls_per_minute, period=60.0)
+            elif delay > 0:
+                limiter = RateLimiter(1, period=delay)
+            else:
+                limiter = None
+            
+            def collect(symbol):
+                if limiter:
+                    limiter.acquire()
+                logger.info(f"Collecting data for {symbol}...")
+                return collection_func(symbol, **kwargs)
+            
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {executor.submit(collect, symbol): symbol for symbol in symbols}
                 
-                if result is not None:
-                    logger.info(f"✓ Successfully collected data for {symbol}")
-                else:
-                    logger.warning(f"✗ No data collected for {symbol}")
-                    
-            except Exception as e:
-                logger.error(f"✗ Error collecting data for {symbol}: {e}")
-                results[symbol] = None
-            
-            # Rate limiting (don't delay after last item)
-            if i < total - 1 and delay > 0:
-                logger.info(f"Waiting {delay} seconds for rate limiting...")
-                time.sleep(delay)
+                for done, future in enumerate(as_completed(futures), start=1):
+                    symbol = futures[future]
+                    try:
+                        result = future.result()
+                        results[symbol] = result
+                        
+                        if result is not None:
+                            logger.info(f"✓ Successfully collected data for {symbol} ({done}/{total})")
+                        else:
+                            logger.warning(f"✗ No data collected for {symbol} ({done}/{total})")
+                            
+                    except Exception as e:
+                        logger.error(f"✗ Error collecting data for {symbol}: {e}")
         
         successful = sum(1 for result in results.values() if result is not None)
         logger.info(f"Batch collection complete: {successful}/{total} successful")
         
         return results
     
-    def get_recommended_symbols(self) -> List[Tuple[str, str]]:
+    def get_recommended_symbols(self) -> Tuple[Tuple[str, str], ...]:
         """
         Get recommended symbols for comprehensive financial markets analysis
         
         Returns:
-            List[Tuple[str, str]]: List of (symbol, asset_type) tuples
+            Tuple[Tuple[str, str], ...]: Immutable tuple of (symbol, asset_type) pairs
         """
-        return [
-            # Major Market Indices
-            ('SPY', 'ETF'),     # S&P 500
-            ('QQQ', 'ETF'),     # NASDAQ 100
-            ('IWM', 'ETF'),     # Russell 2000
-            ('VTI', 'ETF'),     # Total Stock Market
-            
-            # Sector ETFs
-            ('XLK', 'ETF'),     # Technology
-            ('XLF', 'ETF'),     # Financial
-            ('XLE', 'ETF'),     # Energy
-            ('XLV', 'ETF'),     # Healthcare
-            ('XLI', 'ETF'),     # Industrial
-            ('XLY', 'ETF'),     # Consumer Discretionary
-            ('XLP', 'ETF'),     # Consumer Staples
-            ('XLU', 'ETF'),     # Utilities
-            ('XLRE', 'ETF'),    # Real Estate
-            ('XLB', 'ETF'),     # Materials
-            
-            # Blue Chip Stocks
-            ('AAPL', 'Stock'),  # Apple
-            ('MSFT', 'Stock'),  # Microsoft  
-            ('GOOGL', 'Stock'), # Alphabet
-            ('AMZN', 'Stock'),  # Amazon
-            ('TSLA', 'Stock'),  # Tesla
-            ('NVDA', 'Stock'),  # NVIDIA
-            ('JPM', 'Stock'),   # JPMorgan Chase
-            ('JNJ', 'Stock'),   # Johnson & Johnson
-            ('V', 'Stock'),     # Visa
-            ('PG', 'Stock'),    # Procter & Gamble
-            
-            # Bonds & Commodities
-            ('TLT', 'ETF'),     # 20+ Year Treasury Bonds
-            ('SHY', 'ETF'),     # 1-3 Year Treasury Bonds
-            ('GLD', 'ETF'),     # Gold
-            ('VNQ', 'ETF'),     # REITs
-        ]
+        return RECOMMENDED_SYMBOLS
     
-    def get_fred_indicators(self) -> Dict[str, Dict]:
+    def get_fred_indicators(self) -> Mapping[str, Mapping[str, str]]:
         """
         Get recommended FRED economic indicators
         
         Returns:
-            Dict: Dictionary of series_id -> metadata
+            Mapping: Read-only mapping of series_id -> metadata
         """
-        return {
-            'FEDFUNDS': {
-                'name': 'Federal Funds Rate', 
-                'unit': 'Percent', 
-                'frequency': 'Monthly',
-                'source': 'FRED'
-            },
-            'UNRATE': {
-                'name': 'Unemployment Rate', 
-                'unit': 'Percent', 
-                'frequency': 'Monthly',
-                'source': 'FRED'
-            }, 
-            'CPIAUCSL': {
-                'name': 'Consumer Price Index for All Urban Consumers', 
-                'unit': 'Index 1982-84=100', 
-                'frequency': 'Monthly',
-                'source': 'FRED'
-            },
-            'GDP': {
-                'name': 'Gross Domestic Product', 
-                'unit': 'Billions of Dollars', 
-                'frequency': 'Quarterly',
-                'source': 'FRED'
-            },
-            'GS10': {
-                'name': '10-Year Treasury Constant Maturity Rate', 
-                'unit': 'Percent', 
-                'frequency': 'Daily',
-                'source': 'FRED'
-            },
-            'DGS2': {
-                'name': '2-Year Treasury Constant Maturity Rate', 
-                'unit': 'Percent', 
-                'frequency': 'Daily',
-                'source': 'FRED'
-            },
-            'VIXCLS': {
-                'name': 'CBOE Volatility Index: VIX', 
-                'unit': 'Index', 
-                'frequency': 'Daily',
-                'source': 'FRED'
-            },
-            'UMCSENT': {
-                'name': 'University of Michigan: Consumer Sentiment', 
-                'unit': 'Index 1966:Q1=100', 
-                'frequency': 'Monthly',
-                'source': 'FRED'
-            }
-        }
+        return FRED_INDICATORS
 
 
 
@@ -4,27 +4,418 @@ Updated to work with the new master assets table and Alpha Vantage OVERVIEW data
 """
 
 import sqlite3
+import numpy as np
 import pandas as pd
+from collections import defaultdict
+from contextlib import contextmanager
 from datetime import datetime, date
 import os
-from typing import List, Dict, Any, Optional
+import re
+import logging
+from typing import List, Dict, Any, Callable, Iterable, Literal, Optional, Union
+
+from data_setup.components.chunked import MULTI_ROW_VALUES, ChunkedInsert
+from data_setup.utils.kernels import NUMBA_MIN_SIZE, simple_returns
+
+logger = logging.getLogger(__name__)
+
+# Durability relaxed for full-rebuild bulk loads (see FinancialDatabase.bulk_load)
+BULK_LOAD_PRAGMAS = (
+    "PRAGMA journal_mode = OFF",
+    "PRAGMA synchronous = OFF",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -200000",
+    "PRAGMA foreign_keys = OFF"
+)
+
+# Steady-state settings restored after a bulk load
+STEADY_STATE_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA foreign_keys = ON"
+)
+
+InsertMode = Literal['append', 'replace']
+
+# Insert verb per write mode: 'append' for first-time loads right after schema creation,
+# 'replace' for refreshes that may overwrite existing rows
+INSERT_VERBS = {
+    'append': 'INSERT INTO',
+    'replace': 'INSERT OR REPLACE INTO'
+}
+
+
+def _insert_sql(verb: str, table: str, columns) -> str:
+    """Build a single-line parameterized INSERT; SQLite's statement cache keys on the exact text"""
+    return f"{verb} {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+
+
+def _insert_sql_for(statements: Dict[str, str], mode: str) -> str:
+    """Pick the precompiled INSERT statement for a write mode"""
+    try:
+        return statements[mode]
+    except KeyError:
+        raise ValueError(f"mode must be one of {list(statements)}, got {mode!r}")
+
+
+def _insert_sql_by_mode(table: str, columns) -> Dict[str, str]:
+    """Precompile the INSERT statement for every write mode"""
+    return {mode: _insert_sql(verb, table, columns) for mode, verb in INSERT_VERBS.items()}
+
+
+DAILY_PRICE_COLUMNS = ['symbol', 'date', 'open_price', 'high_price', 'low_price',
+                       'close_price', 'adjusted_close', 'volume']
+
+# Columns a price frame must have after renaming (adjusted_close is optional)
+REQUIRED_PRICE_COLUMNS = frozenset(('symbol', 'date', 'open_price', 'high_price',
+                                    'low_price', 'close_price', 'volume'))
+
+# Rows per ChunkedInsert flush when inserting prices (bars already stored are left untouched)
+PRICE_INSERT_CHUNK_SIZE = 5000
+
+ECONOMIC_INDICATOR_COLUMNS = ('indicator_name', 'indicator_code', 'date', 'value', 'unit', 'frequency', 'source')
+
+MARKET_INDEX_COLUMNS = ('symbol', 'date', 'index_value', 'daily_return', 'volume', 'total_market_cap',
+                        'pe_ratio', 'dividend_yield', 'price_to_book', 'constituent_count')
+INSERT_MARKET_INDEX_SQL = _insert_sql_by_mode('market_indices', MARKET_INDEX_COLUMNS)
+
+VOLATILITY_COLUMNS = ('underlying_symbol', 'volatility_type', 'date', 'volatility_value', 'volatility_period')
+
+SECTOR_PERFORMANCE_COLUMNS = ('sector', 'date', 'number_of_assets', 'total_market_cap',
+                              'avg_pe_ratio', 'avg_dividend_yield')
+# 'replace' upserts on UNIQUE(sector, date) so the row is updated in place (OR REPLACE would
+# delete and re-insert it, assigning a new id and wiping the return/volatility columns)
+INSERT_SECTOR_PERFORMANCE_SQL = {
+    'append': _insert_sql('INSERT INTO', 'sector_performance', SECTOR_PERFORMANCE_COLUMNS),
+    'replace': (
+        _insert_sql('INSERT INTO', 'sector_performance', SECTOR_PERFORMANCE_COLUMNS)
+        + " ON CONFLICT(sector, date) DO UPDATE SET "
+        + ', '.join(f"{col} = excluded.{col}" for col in SECTOR_PERFORMANCE_COLUMNS[2:])
+    )
+}
+
+# Assets columns written from OVERVIEW data; order matches COLSPEC
+ASSET_COLUMNS = (
+    'symbol', 'name', 'description', 'cik', 'exchange', 'currency', 'country', 'sector', 'industry',
+    'asset_type', 'market_capitalization', 'ebitda', 'pe_ratio', 'peg_ratio', 'book_value',
+    'dividend_per_share', 'dividend_yield', 'eps', 'revenue_per_share_ttm', 'profit_margin',
+    'operating_margin_ttm', 'return_on_assets_ttm', 'return_on_equity_ttm', 'revenue_ttm',
+    'gross_profit_ttm', 'diluted_eps_ttm', 'quarterly_earnings_growth_yoy',
+    'quarterly_revenue_growth_yoy', 'analyst_target_price', 'trailing_pe', 'forward_pe',
+    'price_to_sales_ratio_ttm', 'price_to_book_ratio', 'ev_to_revenue', 'ev_to_ebitda', 'beta',
+    'week_52_high', 'week_52_low', 'day_50_moving_average', 'day_200_moving_average',
+    'shares_outstanding', 'dividend_date', 'ex_dividend_date'
+)
+
+_ASSET_COLUMN_LIST = ', '.join(ASSET_COLUMNS)
+
+# Update the existing row in place on conflict. INSERT OR REPLACE would delete it first,
+# which cascades through the foreign keys and wipes the asset's price/volatility history.
+_ASSET_CONFLICT_CLAUSE = (
+    "ON CONFLICT(symbol) DO UPDATE SET "
+    + ', '.join(f"{col} = excluded.{col}" for col in ASSET_COLUMNS[1:])
+    + ", last_updated = datetime('now')"
+)
+
+# Plain insert for append-mode loads into an empty table (no conflict probing)
+APPEND_ASSET_SQL = _insert_sql('INSERT INTO', 'assets', ASSET_COLUMNS)
+
+# Upsert for the master assets table
+INSERT_ASSET_SQL = f"{APPEND_ASSET_SQL} {_ASSET_CONFLICT_CLAUSE}"
+
+INSERT_ASSETS_SQL = {
+    'append': APPEND_ASSET_SQL,
+    'replace': INSERT_ASSET_SQL
+}
+
+# Staging-table upsert used by FinancialDatabase.upsert_assets_batch
+CREATE_ASSET_STAGE_SQL = "CREATE TEMP TABLE _assets_stage AS SELECT * FROM assets WHERE 0"
+INSERT_ASSET_STAGE_SQL = _insert_sql('INSERT INTO', '_assets_stage', ASSET_COLUMNS)
+MERGE_ASSET_STAGE_SQL = (
+    f"INSERT INTO assets ({_ASSET_COLUMN_LIST}) "
+    f"SELECT {_ASSET_COLUMN_LIST} FROM _assets_stage WHERE true "
+    f"{_ASSET_CONFLICT_CLAUSE}"
+)
+DROP_ASSET_STAGE_SQL = "DROP TABLE IF EXISTS temp._assets_stage"
+
+
+# Partial covering indexes for the get_data_summary breakdowns, created on top of schema.sql
+# (daily_prices(symbol, date) is already indexed there for get_latest_price_date)
+SUMMARY_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_assets_active_type "
+    "ON assets(asset_type, market_capitalization) WHERE is_active = TRUE",
+    "CREATE INDEX IF NOT EXISTS idx_assets_active_sector "
+    "ON assets(sector, pe_ratio) WHERE is_active = TRUE AND sector IS NOT NULL"
+)
+
+# Natural keys of the time-series tables. create_database() rebuilds these as WITHOUT ROWID
+# tables clustered on the key when the schema gives them a rowid/"id" surrogate instead, so
+# the primary-key B-tree holds the rows and no separate UNIQUE index has to be maintained.
+WITHOUT_ROWID_KEYS = {
+    'daily_prices': ('symbol', 'date'),
+    'economic_indicators': ('indicator_name', 'date'),
+    'volatility_data': ('underlying_symbol', 'volatility_type', 'date', 'volatility_period')
+}
+
+_SURROGATE_ID_PATTERN = re.compile(r'\s*\bid\s+INTEGER\s+PRIMARY\s+KEY(\s+AUTOINCREMENT)?\s*,', re.IGNORECASE)
+
+# Tables reported by get_data_summary, counted in a single statement
+SUMMARY_TABLES = ('assets', 'daily_prices', 'economic_indicators',
+                  'sector_performance', 'market_indices', 'volatility_data')
+COUNT_TABLES_SQL = "SELECT " + ", ".join(f"(SELECT COUNT(*) FROM {table})" for table in SUMMARY_TABLES)
+
+LATEST_PRICE_DATE_SQL = "SELECT MAX(date) FROM daily_prices WHERE symbol = ?"
+ASSET_OVERVIEW_SQL = "SELECT * FROM assets WHERE symbol = ?"
+
+
+# Alpha Vantage placeholders for a missing value
+_NULLS = frozenset(('None', '-', 'N/A', '', None))
+
+
+def _to_str(value):
+    """Pass a text field through unchanged"""
+    return value
+
+
+def _to_float(value):
+    """Convert an Alpha Vantage field to float, None for placeholders or bad input"""
+    if value in _NULLS:
+        return None
+    if isinstance(value, float):
+        return value
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _to_int(value):
+    """Convert an Alpha Vantage field to int, None for placeholders or bad input"""
+    if value in _NULLS:
+        return None
+    try:
+        return int(float(value))
+    except (ValueError, TypeError):
+        return None
+
+
+def _to_date(value):
+    """Convert a YYYY-MM-DD Alpha Vantage field to a date, None for placeholders or bad input"""
+    if value in _NULLS:
+        return None
+    if isinstance(value, date):
+        return value
+    # Slice the fixed-width fields directly; strptime is far slower for a known format
+    try:
+        return date(int(value[0:4]), int(value[5:7]), int(value[8:10]))
+    except (ValueError, TypeError, IndexError):
+        return None
+
+
+def _derive_daily_returns(index_data: List[Dict[str, Any]]) -> List[Optional[float]]:
+    """
+    Fill in missing daily_return values from consecutive index_value rows of each symbol
+    
+    Args:
+        index_data (List[Dict]): Market index records (symbol, date, index_value, ...)
+    
+    Returns:
+        List[Optional[float]]: daily_return per record, aligned with index_data; supplied
+                               values are kept, the first row of each symbol stays None
+    """
+    returns = [record.get('daily_return') for record in index_data]
+    if all(value is not None for value in returns):
+        return returns
+    
+    # Record positions per symbol, in date order; undated rows can't be ordered and keep their value
+    positions = defaultdict(list)
+    for i, record in enumerate(index_data):
+        if record.get('index_value') is not None and record.get('date') is not None:
+            positions[record.get('symbol')].append(i)
+    
+    for rows in positions.values():
+        rows.sort(key=lambda i: str(index_data[i]['date']))
+        prices = np.array([index_data[i]['index_value'] for i in rows], dtype=np.float64)
+        if prices.size >= NUMBA_MIN_SIZE:
+            values = simple_returns(prices)
+        else:
+            values = np.empty_like(prices)
+            values[:1] = np.nan
+            values[1:] = prices[1:] / prices[:-1] - 1
+        for i, value in zip(rows, values.tolist()):
+            if returns[i] is None and value == value:  # Skip NaN (first row of the symbol)
+                returns[i] = value
+    
+    return returns
+
+
+def _standardize_price_frame(price_data: pd.DataFrame, symbol: str = None) -> Optional[pd.DataFrame]:
+    """
+    Rename yfinance-style price columns to daily_prices columns without copying the input
+    
+    Args:
+        price_data (pd.DataFrame): DataFrame with price data
+        symbol (str): Symbol if not in DataFrame
+    
+    Returns:
+        pd.DataFrame: Standardized frame, or None if required columns are missing
+    """
+    df = price_data
+    
+    # Reset index if date is in index
+    if df.index.name == 'Date' or 'date' in str(df.index.name).lower():
+        df = df.reset_index()
+    
+    # Standardize column names
+    column_mapping = {
+        'Date': 'date',
+        'Open': 'open_price',
+        'High': 'high_price', 
+        'Low': 'low_price',
+        'Close': 'close_price',
+        'Adj Close': 'adjusted_close',
+        'Volume': 'volume'
+    }
+    df = df.rename(columns=column_mapping)
+    
+    # Add symbol if not present (df is a new frame after rename, caller's data is untouched)
+    if symbol and 'symbol' not in df.columns:
+        df['symbol'] = symbol
+    
+    # Ensure we have required columns
+    missing_cols = REQUIRED_PRICE_COLUMNS.difference(df.columns)
+    
+    if missing_cols:
+        logger.warning(f"Missing columns {sorted(missing_cols)}")
+        return None
+    
+    return df
+
+
+def _price_row_chunks(df: pd.DataFrame):
+    """
+    Yield daily_prices parameter rows in PRICE_INSERT_CHUNK_SIZE chunks
+    
+    Args:
+        df (pd.DataFrame): Frame from _standardize_price_frame
+    
+    Yields:
+        Iterator[tuple]: Row tuples for one chunk
+    """
+    for start in range(0, len(df), PRICE_INSERT_CHUNK_SIZE):
+        # Adjusted close is optional (yfinance omits it with auto_adjust)
+        chunk = df.iloc[start:start + PRICE_INSERT_CHUNK_SIZE].reindex(columns=DAILY_PRICE_COLUMNS)
+        chunk['date'] = pd.to_datetime(chunk['date'], format='ISO8601', cache=True).dt.strftime('%Y-%m-%d')
+        yield chunk.itertuples(index=False, name=None)
+
+
+# (OVERVIEW key, converter, default) in ASSET_COLUMNS order
+COLSPEC = (
+    ('Symbol', _to_str, None),
+    ('Name', _to_str, None),
+    ('Description', _to_str, None),
+    ('CIK', _to_str, None),
+    ('Exchange', _to_str, None),
+    ('Currency', _to_str, 'USD'),
+    ('Country', _to_str, None),
+    ('Sector', _to_str, None),
+    ('Industry', _to_str, None),
+    ('AssetType', _to_str, 'Stock'),
+    ('MarketCapitalization', _to_int, None),
+    ('EBITDA', _to_int, None),
+    ('PERatio', _to_float, None),
+    ('PEGRatio', _to_float, None),
+    ('BookValue', _to_float, None),
+    ('DividendPerShare', _to_float, None),
+    ('DividendYield', _to_float, None),
+    ('EPS', _to_float, None),
+    ('RevenuePerShareTTM', _to_float, None),
+    ('ProfitMargin', _to_float, None),
+    ('OperatingMarginTTM', _to_float, None),
+    ('ReturnOnAssetsTTM', _to_float, None),
+    ('ReturnOnEquityTTM', _to_float, None),
+    ('RevenueTTM', _to_int, None),
+    ('GrossProfitTTM', _to_int, None),
+    ('DilutedEPSTTM', _to_float, None),
+    ('QuarterlyEarningsGrowthYOY', _to_float, None),
+    ('QuarterlyRevenueGrowthYOY', _to_float, None),
+    ('AnalystTargetPrice', _to_float, None),
+    ('TrailingPE', _to_float, None),
+    ('ForwardPE', _to_float, None),
+    ('PriceToSalesRatioTTM', _to_float, None),
+    ('PriceToBookRatio', _to_float, None),
+    ('EVToRevenue', _to_float, None),
+    ('EVToEBITDA', _to_float, None),
+    ('Beta', _to_float, None),
+    ('52WeekHigh', _to_float, None),
+    ('52WeekLow', _to_float, None),
+    ('50DayMovingAverage', _to_float, None),
+    ('200DayMovingAverage', _to_float, None),
+    ('SharesOutstanding', _to_int, None),
+    ('DividendDate', _to_date, None),
+    ('ExDividendDate', _to_date, None)
+)
+
+
+def _build_asset_row(asset_data: Dict[str, Any]) -> tuple:
+    """
+    Build the 43-column assets row from Alpha Vantage OVERVIEW-style data
+    
+    Args:
+        asset_data (Dict): Dictionary containing asset information from Alpha Vantage OVERVIEW
+    
+    Returns:
+        tuple: Values in ASSET_COLUMNS order
+    """
+    get = asset_data.get
+    return tuple([convert(get(key, default)) for key, convert, default in COLSPEC])
+
 
 class FinancialDatabase:
-    def __init__(self, db_path: str = "database_and_schema/financial_markets.db"):
+    def __init__(self, db_path: str = "database_and_schema/financial_markets.db", auto_connect: bool = True):
         """
         Initialize the database connection
         
         Args:
             db_path (str): Path to the SQLite database file
+            auto_connect (bool): Connect immediately. Methods assume an open connection, so
+                                 call connect() before use when this is False.
         """
         self.db_path = db_path
         self.connection = None
+        self._cursor = None  # Reused by the getters and transaction control
+        self._asset_columns = None  # assets column names, read once via PRAGMA table_info
+        self._atomic = 0  # Depth of open transaction() blocks, where failed inserts raise instead of logging
+        
+        if auto_connect:
+            self.connect()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
     
     def connect(self):
-        """Create connection to the database"""
+        """Create connection to the database (no-op if already connected)"""
+        if self.connection is not None:
+            return self.connection
+        
         try:
-            self.connection = sqlite3.connect(self.db_path)
+            # Autocommit mode: transactions are opened explicitly by _transaction()/bulk_load()
+            self.connection = sqlite3.connect(self.db_path, isolation_level=None,
+                                              cached_statements=256, check_same_thread=False)
+            # page_size only applies to a new, empty file, so it must precede the WAL switch
+            self.connection.execute("PRAGMA page_size = 8192")
             self.connection.execute("PRAGMA foreign_keys = ON")  # Enable foreign key constraints
+            self.connection.execute("PRAGMA journal_mode = WAL")  # Readers don't block the writer
+            self.connection.execute("PRAGMA synchronous = NORMAL")  # WAL is durable at checkpoints; no fsync per commit
+            self.connection.execute("PRAGMA temp_store = MEMORY")  # Sorts and temp indexes stay off disk
+            self.connection.execute("PRAGMA mmap_size = 268435456")  # Read pages through a 256MB memory map
+            self.connection.execute("PRAGMA cache_size = -200000")  # ~200MB page cache
+            self._cursor = self.connection.cursor()
+            self._asset_columns = None
             print(f"Connected to database: {self.db_path}")
             return self.connection
         except sqlite3.Error as e:
@@ -35,8 +426,85 @@ class FinancialDatabase:
         """Close the database connection"""
         if self.connection:
             self.connection.close()
+            self.connection = None
+            self._cursor = None
             print("Database connection closed")
     
+    @contextmanager
+    def bulk_load(self):
+        """
+        Context manager for fast bulk ingest (initial schema load, full rebuilds)
+        
+        Turns off journaling, fsyncs and foreign key checks for the duration of the block,
+        then runs ANALYZE and restores WAL / synchronous=NORMAL / foreign_keys=ON. A crash
+        inside the block can corrupt the database, so only use it when the data can be
+        regenerated.
+        """
+        # journal_mode and foreign_keys can't change inside an open transaction
+        self.connection.commit()
+        for pragma in BULK_LOAD_PRAGMAS:
+            self._cursor.execute(pragma)
+        
+        try:
+            # One transaction for the whole block; the insert_* methods join it
+            with self._transaction():
+                yield self
+            self._cursor.execute("ANALYZE")  # Refresh planner statistics for the new data
+        finally:
+            for pragma in STEADY_STATE_PRAGMAS:
+                self._cursor.execute(pragma)
+    
+    @contextmanager
+    def transaction(self):
+        """
+        Context manager grouping many writes into one all-or-nothing transaction
+        
+        Insert methods called inside the block join it through savepoints and, instead of
+        logging and carrying on, re-raise their errors, so a failed insert rolls back every
+        write in the block (one commit, one fsync on success). Example:
+        
+            with db.transaction():
+                db.insert_asset(asset)
+                db.insert_daily_prices(prices, symbol)
+        """
+        self._atomic += 1
+        try:
+            with self._transaction():
+                yield self
+        finally:
+            self._atomic -= 1
+    
+    @contextmanager
+    def _transaction(self):
+        """
+        Run a block inside an explicit BEGIN ... COMMIT, rolling back on error
+        
+        The connection is in autocommit mode, so writes only batch into a transaction
+        when wrapped here. If a transaction is already open (e.g. inside bulk_load or
+        transaction()), the block runs in a savepoint of it and the outer owner commits.
+        """
+        if self.connection.in_transaction:
+            self._cursor.execute("SAVEPOINT nested_write")
+            try:
+                yield
+            except BaseException:
+                self._cursor.execute("ROLLBACK TO nested_write")
+                self._cursor.execute("RELEASE nested_write")
+                raise
+            self._cursor.execute("RELEASE nested_write")
+            return
+        
+        # IMMEDIATE takes the write lock up front; every caller writes, and a deferred
+        # transaction would otherwise have to upgrade its lock mid-way (SQLITE_BUSY risk)
+        self._cursor.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self.connection.rollback()
+            raise
+        # No-op if the block already ended the transaction (executescript commits first)
+        self.connection.commit()
+    
     def create_database(self, schema_file: str = 'database_and_schema/schema.sql'):
         """
         Create the database tables using the SQL schema
@@ -44,15 +512,17 @@ class FinancialDatabase:
         Args:
             schema_file (str): Path to SQL schema file (optional)
         """
-        if not self.connection:
-            self.connect()
-        
         if schema_file and os.path.exists(schema_file):
             with open(schema_file, 'r') as file:
                 schema_sql = file.read()
             try:
                 self.connection.executescript(schema_sql)
+                for index_sql in SUMMARY_INDEXES:
+                    self.connection.execute(index_sql)
+                for table, key in WITHOUT_ROWID_KEYS.items():
+                    self._rebuild_without_rowid(table, key)
                 self.connection.commit()
+                self._asset_columns = None  # Schema may have changed
                 print(f"Database schema created successfully from {schema_file}")
             except sqlite3.Error as e:
                 print(f"Error creating database schema: {e}")
@@ -60,6 +530,59 @@ class FinancialDatabase:
             print("Creating database with embedded schema...")
             print("Run the SQL schema artifact to create tables first")
     
+    def _rebuild_without_rowid(self, table: str, key: tuple):
+        """
+        Rebuild a rowid table as WITHOUT ROWID with PRIMARY KEY(key)
+        
+        Drops the "id INTEGER PRIMARY KEY" surrogate, promotes the matching UNIQUE(key)
+        constraint to the primary key, copies the rows and recreates the table's indexes
+        (except those the new primary key already covers). Tables that are already
+        WITHOUT ROWID are left alone; schemas that don't match the expected shape are
+        reported and left unchanged.
+        
+        Args:
+            table (str): Table name
+            key (tuple): Natural key columns, matching a UNIQUE constraint in the schema
+        """
+        row = self._cursor.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+        ).fetchone()
+        if not row or re.search(r'WITHOUT\s+ROWID', row[0], re.IGNORECASE):
+            return
+        
+        create_sql = row[0]
+        unique_pattern = re.compile(r'UNIQUE\s*\(\s*' + r'\s*,\s*'.join(key) + r'\s*\)', re.IGNORECASE)
+        if not _SURROGATE_ID_PATTERN.search(create_sql) or not unique_pattern.search(create_sql):
+            print(f"Warning: {table} is a rowid table; declare it WITHOUT ROWID with PRIMARY KEY{key} in the schema")
+            return
+        
+        new_table = f"{table}_new"
+        create_sql = _SURROGATE_ID_PATTERN.sub('', create_sql, count=1)
+        create_sql = unique_pattern.sub(f"PRIMARY KEY ({', '.join(key)})", create_sql, count=1)
+        create_sql = re.sub(rf'^CREATE\s+TABLE\s+"?{table}"?', f"CREATE TABLE {new_table}", create_sql, count=1)
+        create_sql += " WITHOUT ROWID"
+        
+        # Keep secondary indexes, minus those that are a prefix of the new primary key
+        indexes = []
+        for name, index_sql in self._cursor.execute(
+            "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL", (table,)
+        ).fetchall():
+            columns = tuple(info[2] for info in self._cursor.execute(f"PRAGMA index_info({name})").fetchall())
+            if columns != key[:len(columns)]:
+                indexes.append(index_sql)
+        
+        with self._transaction():
+            self._cursor.execute(create_sql)
+            columns = ', '.join(info[1] for info in self._cursor.execute(f"PRAGMA table_info({new_table})").fetchall())
+            self._cursor.execute(f"INSERT INTO {new_table} ({columns}) SELECT {columns} FROM {table}")
+            self._cursor.execute(f"DROP TABLE {table}")
+            # Legacy rename skips re-validating views, which reference the table being replaced
+            self._cursor.execute("PRAGMA legacy_alter_table = ON")
+            self._cursor.execute(f"ALTER TABLE {new_table} RENAME TO {table}")
+            self._cursor.execute("PRAGMA legacy_alter_table = OFF")
+            for index_sql in indexes:
+                self._cursor.execute(index_sql)
+    
     def insert_asset(self, asset_data: Dict[str, Any]):
         """
         Insert or update a single asset with Alpha Vantage OVERVIEW data
@@ -67,285 +590,287 @@ class FinancialDatabase:
         Args:
             asset_data (Dict): Dictionary containing asset information from Alpha Vantage OVERVIEW
         """
-        if not self.connection:
-            self.connect()
-        
         cursor = self.connection.cursor()
         
-
         try:
-            # Helper function to clean and convert values
-            def clean_value(value, data_type='str'):
-                if value in ['None', '-', 'N/A', '', None]:
-                    return None
-                if data_type == 'float':
-                    try:
-                        return float(value)
-                    except (ValueError, TypeError):
-                        return None
-                elif data_type == 'int':
-                    try:
-                        return int(float(value))
-                    except (ValueError, TypeError):
-                        return None
-                elif data_type == 'date':
-                    if value and value != 'None':
-                        try:
-                            return datetime.strptime(value, '%Y-%m-%d').date()
-                        except ValueError:
-                            return None
-                    return None
-                return str(value) if value else None
+            values = _build_asset_row(asset_data)
+            with self._transaction():
+                cursor.execute(INSERT_ASSET_SQL, values)
             
-            insert_sql = """
-                INSERT OR REPLACE INTO assets 
-                (symbol, name, description, cik, exchange, currency, country, sector, industry, asset_type,
-                market_capitalization, ebitda, pe_ratio, peg_ratio, book_value, dividend_per_share, 
-                dividend_yield, eps, revenue_per_share_ttm, profit_margin, operating_margin_ttm,
-                return_on_assets_ttm, return_on_equity_ttm, revenue_ttm, gross_profit_ttm, 
-                diluted_eps_ttm, quarterly_earnings_growth_yoy, quarterly_revenue_growth_yoy,
-                analyst_target_price, trailing_pe, forward_pe, price_to_sales_ratio_ttm,
-                price_to_book_ratio, ev_to_revenue, ev_to_ebitda, beta, week_52_high, week_52_low,
-                day_50_moving_average, day_200_moving_average, shares_outstanding, dividend_date,
-                ex_dividend_date)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """
-        
-            values = (
-                    asset_data.get('Symbol'),
-                    asset_data.get('Name'),
-                    asset_data.get('Description'),
-                    asset_data.get('CIK'),
-                    asset_data.get('Exchange'),
-                    asset_data.get('Currency', 'USD'),
-                    asset_data.get('Country'),
-                    asset_data.get('Sector'),
-                    asset_data.get('Industry'),
-                    asset_data.get('AssetType', 'Stock'),
-                    clean_value(asset_data.get('MarketCapitalization'), 'int'),
-                    clean_value(asset_data.get('EBITDA'), 'int'),
-                    clean_value(asset_data.get('PERatio'), 'float'),
-                    clean_value(asset_data.get('PEGRatio'), 'float'),
-                    clean_value(asset_data.get('BookValue'), 'float'),
-                    clean_value(asset_data.get('DividendPerShare'), 'float'),
-                    clean_value(asset_data.get('DividendYield'), 'float'),
-                    clean_value(asset_data.get('EPS'), 'float'),
-                    clean_value(asset_data.get('RevenuePerShareTTM'), 'float'),
-                    clean_value(asset_data.get('ProfitMargin'), 'float'),
-                    clean_value(asset_data.get('OperatingMarginTTM'), 'float'),
-                    clean_value(asset_data.get('ReturnOnAssetsTTM'), 'float'),
-                    clean_value(asset_data.get('ReturnOnEquityTTM'), 'float'),
-                    clean_value(asset_data.get('RevenueTTM'), 'int'),
-                    clean_value(asset_data.get('GrossProfitTTM'), 'int'),
-                    clean_value(asset_data.get('DilutedEPSTTM'), 'float'),
-                    clean_value(asset_data.get('QuarterlyEarningsGrowthYOY'), 'float'),
-                    clean_value(asset_data.get('QuarterlyRevenueGrowthYOY'), 'float'),
-                    clean_value(asset_data.get('AnalystTargetPrice'), 'float'),
-                    clean_value(asset_data.get('TrailingPE'), 'float'),
-                    clean_value(asset_data.get('ForwardPE'), 'float'),
-                    clean_value(asset_data.get('PriceToSalesRatioTTM'), 'float'),
-                    clean_value(asset_data.get('PriceToBookRatio'), 'float'),
-                    clean_value(asset_data.get('EVToRevenue'), 'float'),
-                    clean_value(asset_data.get('EVToEBITDA'), 'float'),
-                    clean_value(asset_data.get('Beta'), 'float'),
-                    clean_value(asset_data.get('52WeekHigh'), 'float'),
-                    clean_value(asset_data.get('52WeekLow'), 'float'),
-                    clean_value(asset_data.get('50DayMovingAverage'), 'float'),
-                    clean_value(asset_data.get('200DayMovingAverage'), 'float'),
-                    clean_value(asset_data.get('SharesOutstanding'), 'int'),
-                    clean_value(asset_data.get('DividendDate'), 'date'),
-                    clean_value(asset_data.get('ExDividendDate'), 'date')
-                )
-        
-            print(f"Number of values: {len(values)}")
-            cursor.execute(insert_sql, values)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Inserted/updated asset: {asset_data.get('Symbol')}")
             
-            self.connection.commit()
-            print(f"Inserted/updated asset: {asset_data.get('Symbol')}")
+        except sqlite3.Error as e:
+            if self._atomic:
+                raise
+            logger.error(f"Error inserting asset data for {asset_data.get('Symbol', 'Unknown')}: {e}")
+    
+    def insert_assets_batch(self, assets_list: List[Dict[str, Any]], mode: InsertMode = 'replace'):
+        """
+        Insert multiple assets in batch (single executemany inside one transaction)
+        
+        Args:
+            assets_list (List[Dict]): List of asset dictionaries
+            mode (str): 'replace' upserts existing symbols, 'append' does a plain INSERT
+                        (initial loads into an empty table)
+        """
+        insert_sql = _insert_sql_for(INSERT_ASSETS_SQL, mode)
+        
+        try:
+            rows = [_build_asset_row(asset) for asset in assets_list]
+            with self._transaction():
+                self.connection.executemany(insert_sql, rows)
+            logger.debug(f"Batch insert completed: {len(assets_list)} assets")
             
         except sqlite3.Error as e:
-            print(f"Error inserting asset data for {asset_data.get('Symbol', 'Unknown')}: {e}")
+            if self._atomic:
+                raise
+            logger.error(f"Error inserting asset batch: {e}")
     
-    def insert_assets_batch(self, assets_list: List[Dict[str, Any]]):
+    def upsert_assets_batch(self, assets_list: List[Dict[str, Any]]):
         """
-        Insert multiple assets in batch
+        Upsert many assets through a temp staging table in one transaction
+        
+        Rows are bulk-loaded into _assets_stage and merged into assets with a single
+        INSERT ... SELECT ... ON CONFLICT(symbol) DO UPDATE, so existing assets are updated
+        in place and their dependent price rows are left alone.
         
         Args:
             assets_list (List[Dict]): List of asset dictionaries
         """
-        for asset in assets_list:
-            self.insert_asset(asset)
-        print(f"Batch insert completed: {len(assets_list)} assets")
+        cursor = self.connection.cursor()
+        
+        try:
+            with self._transaction():
+                cursor.execute(DROP_ASSET_STAGE_SQL)
+                cursor.execute(CREATE_ASSET_STAGE_SQL)
+                cursor.executemany(INSERT_ASSET_STAGE_SQL, [_build_asset_row(asset) for asset in assets_list])
+                cursor.execute(MERGE_ASSET_STAGE_SQL)
+            logger.debug(f"Batch upsert completed: {len(assets_list)} assets")
+            
+        except sqlite3.Error as e:
+            if self._atomic:
+                raise
+            logger.error(f"Error upserting asset batch: {e}")
+        
+        finally:
+            cursor.execute(DROP_ASSET_STAGE_SQL)
     
-    def insert_daily_prices(self, price_data: pd.DataFrame, symbol: str = None):
+    def insert_daily_prices(self, price_data: Union[pd.DataFrame, Iterable[pd.DataFrame]], symbol: str = None,
+                            callback: Callable[[int], None] = None):
         """
         Insert daily price data into daily_prices table
         
+        Rows are streamed through ChunkedInsert, so an iterator of frames (e.g. a long
+        backfill read piece by piece) is written with bounded memory in one transaction.
+        
         Args:
-            price_data (pd.DataFrame): DataFrame with price data
+            price_data (pd.DataFrame or Iterable[pd.DataFrame]): DataFrame(s) with price data
             symbol (str): Symbol if not in DataFrame
+            callback (Callable[[int], None]): Progress hook, called with the rows written after each chunk
         """
-        if not self.connection:
-            self.connect()
+        frames = [price_data] if isinstance(price_data, pd.DataFrame) else price_data
         
         try:
-            # Prepare the DataFrame
-            df = price_data.copy()
-            
-            # Add symbol if not present
-            if symbol and 'symbol' not in df.columns:
-                df['symbol'] = symbol
-            
-            # Reset index if date is in index
-            if df.index.name == 'Date' or 'date' in str(df.index.name).lower():
-                df = df.reset_index()
-                if 'Date' in df.columns:
-                    df = df.rename(columns={'Date': 'date'})
-            
-            # Standardize column names
-            column_mapping = {
-                'Open': 'open_price',
-                'High': 'high_price', 
-                'Low': 'low_price',
-                'Close': 'close_price',
-                'Adj Close': 'adjusted_close',
-                'Volume': 'volume'
-            }
-            df = df.rename(columns=column_mapping)
+            total = 0
+            with ChunkedInsert(self, 'daily_prices', DAILY_PRICE_COLUMNS, chunksize=PRICE_INSERT_CHUNK_SIZE,
+                               callback=callback, rows_per_statement=MULTI_ROW_VALUES) as writer:
+                for frame in frames:
+                    df = _standardize_price_frame(frame, symbol)
+                    if df is None:
+                        continue
+                    
+                    total += len(df)
+                    for rows in _price_row_chunks(df):
+                        writer.insert_many(rows)
             
-            # Ensure we have required columns
-            required_cols = ['symbol', 'date', 'open_price', 'high_price', 'low_price', 'close_price', 'volume']
-            missing_cols = [col for col in required_cols if col not in df.columns]
+            logger.debug(f"Inserted {writer.rowcount} of {total} price records for {symbol or 'multiple symbols'}")
             
-            if missing_cols:
-                print(f"Warning: Missing columns {missing_cols}")
-                return
-            
-            # Insert data
-            df.to_sql('daily_prices', self.connection, if_exists='append', 
-                     index=False, method='ignore')
+        except Exception as e:
+            if self._atomic:
+                raise
+            logger.error(f"Error inserting price data: {e}")
+    
+    def insert_daily_prices_many(self, price_frames: Dict[str, pd.DataFrame], callback: Callable[[int], None] = None):
+        """
+        Insert daily price data for many symbols in one transaction
+        
+        Every frame is streamed through the same multi-row ChunkedInsert writer, so rows are
+        bound chunk by chunk without materializing all symbols' tuples up front. A frame that
+        can't be standardized is logged and skipped.
+        
+        Args:
+            price_frames (Dict[str, pd.DataFrame]): Symbol -> DataFrame with price data
+            callback (Callable[[int], None]): Progress hook, called with the rows written after each chunk
+        """
+        total = 0
+        
+        try:
+            with ChunkedInsert(self, 'daily_prices', DAILY_PRICE_COLUMNS, chunksize=PRICE_INSERT_CHUNK_SIZE,
+                               callback=callback, rows_per_statement=MULTI_ROW_VALUES) as writer:
+                for symbol, frame in price_frames.items():
+                    try:
+                        df = _standardize_price_frame(frame, symbol)
+                    except Exception as e:
+                        if self._atomic:
+                            raise
+                        logger.error(f"Error preparing price data for {symbol}: {e}")
+                        continue
+                    if df is None:
+                        continue
+                    
+                    total += len(df)
+                    for rows in _price_row_chunks(df):
+                        writer.insert_many(rows)
             
-            print(f"Inserted {len(df)} price records for {symbol or 'multiple symbols'}")
+            logger.debug(f"Inserted {writer.rowcount} of {total} price records for {len(price_frames)} symbols")
             
         except Exception as e:
-            print(f"Error inserting price data: {e}")
+            if self._atomic:
+                raise
+            logger.error(f"Error inserting price data: {e}")
     
-    def insert_economic_indicators(self, indicator_data: List[Dict[str, Any]]):
+    def insert_economic_indicators(self, indicator_data: List[Dict[str, Any]], mode: InsertMode = 'replace'):
         """
         Insert economic indicator data
         
         Args:
             indicator_data (List[Dict]): List of economic indicator records
+            mode (str): 'replace' overwrites rows with the same key, 'append' does a plain INSERT
         """
-        if not self.connection:
-            self.connect()
-        
-        cursor = self.connection.cursor()
-        
-        insert_sql = """
-        INSERT OR REPLACE INTO economic_indicators 
-        (indicator_name, indicator_code, date, value, unit, frequency, source)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-        """
+        verb = _insert_sql_for(INSERT_VERBS, mode)
         
         try:
-            for indicator in indicator_data:
-                cursor.execute(insert_sql, (
-                    indicator.get('indicator_name'),
-                    indicator.get('indicator_code'),
-                    indicator.get('date'),
-                    indicator.get('value'),
-                    indicator.get('unit'),
-                    indicator.get('frequency'),
-                    indicator.get('source')
+            with ChunkedInsert(self, 'economic_indicators', ECONOMIC_INDICATOR_COLUMNS, verb=verb,
+                               rows_per_statement=MULTI_ROW_VALUES) as writer:
+                writer.insert_many((
+                    (
+                        indicator.get('indicator_name'),
+                        indicator.get('indicator_code'),
+                        indicator.get('date'),
+                        indicator.get('value'),
+                        indicator.get('unit'),
+                        indicator.get('frequency'),
+                        indicator.get('source')
+                    )
+                    for indicator in indicator_data
                 ))
             
-            self.connection.commit()
-            print(f"Inserted {len(indicator_data)} economic indicator records")
+            logger.debug(f"Inserted {len(indicator_data)} economic indicator records")
             
         except sqlite3.Error as e:
-            print(f"Error inserting economic indicators: {e}")
+            if self._atomic:
+                raise
+            logger.error(f"Error inserting economic indicators: {e}")
     
-    def insert_market_indices(self, index_data: List[Dict[str, Any]]):
+    def insert_market_indices(self, index_data: List[Dict[str, Any]], mode: InsertMode = 'replace'):
         """
         Insert market indices data
         
+        Missing daily_return values are derived from the previous index_value of the same
+        symbol within the batch.
+        
         Args:
             index_data (List[Dict]): List of market index records
+            mode (str): 'replace' overwrites rows with the same key, 'append' does a plain INSERT
         """
-        if not self.connection:
-            self.connect()
-        
         cursor = self.connection.cursor()
         
-        insert_sql = """
-        INSERT OR REPLACE INTO market_indices 
-        (symbol, date, index_value, daily_return, volume, total_market_cap, 
-         pe_ratio, dividend_yield, price_to_book, constituent_count)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """
+        insert_sql = _insert_sql_for(INSERT_MARKET_INDEX_SQL, mode)
         
         try:
-            for index_record in index_data:
-                cursor.execute(insert_sql, (
-                    index_record.get('symbol'),
-                    index_record.get('date'),
-                    index_record.get('index_value'),
-                    index_record.get('daily_return'),
-                    index_record.get('volume'),
-                    index_record.get('total_market_cap'),
-                    index_record.get('pe_ratio'),
-                    index_record.get('dividend_yield'),
-                    index_record.get('price_to_book'),
-                    index_record.get('constituent_count')
+            daily_returns = _derive_daily_returns(index_data)
+            with self._transaction():
+                cursor.executemany(insert_sql, (
+                    (
+                        index_record.get('symbol'),
+                        index_record.get('date'),
+                        index_record.get('index_value'),
+                        daily_return,
+                        index_record.get('volume'),
+                        index_record.get('total_market_cap'),
+                        index_record.get('pe_ratio'),
+                        index_record.get('dividend_yield'),
+                        index_record.get('price_to_book'),
+                        index_record.get('constituent_count')
+                    )
+                    for index_record, daily_return in zip(index_data, daily_returns)
                 ))
             
-            self.connection.commit()
-            print(f"Inserted {len(index_data)} market index records")
+            logger.debug(f"Inserted {len(index_data)} market index records")
             
         except sqlite3.Error as e:
-            print(f"Error inserting market indices data: {e}")
+            if self._atomic:
+                raise
+            logger.error(f"Error inserting market indices data: {e}")
     
-    def insert_volatility_data(self, volatility_data: List[Dict[str, Any]]):
+    def insert_volatility_data(self, volatility_data: List[Dict[str, Any]], mode: InsertMode = 'replace'):
         """
         Insert volatility data
         
         Args:
             volatility_data (List[Dict]): List of volatility records
+            mode (str): 'replace' overwrites rows with the same key, 'append' does a plain INSERT
         """
-        if not self.connection:
-            self.connect()
+        verb = _insert_sql_for(INSERT_VERBS, mode)
         
-        cursor = self.connection.cursor()
+        try:
+            with ChunkedInsert(self, 'volatility_data', VOLATILITY_COLUMNS, verb=verb,
+                               rows_per_statement=MULTI_ROW_VALUES) as writer:
+                writer.insert_many((
+                    (
+                        vol_record.get('underlying_symbol'),
+                        vol_record.get('volatility_type'),
+                        vol_record.get('date'),
+                        vol_record.get('volatility_value'),
+                        vol_record.get('volatility_period')
+                    )
+                    for vol_record in volatility_data
+                ))
+            
+            logger.debug(f"Inserted {len(volatility_data)} volatility records")
+            
+        except sqlite3.Error as e:
+            if self._atomic:
+                raise
+            logger.error(f"Error inserting volatility data: {e}")
+    
+    def insert_sector_performance(self, sector_data: List[Dict[str, Any]], mode: InsertMode = 'replace'):
+        """
+        Insert sector performance snapshots
         
-        insert_sql = """
-        INSERT OR REPLACE INTO volatility_data 
-        (underlying_symbol, volatility_type, date, volatility_value, volatility_period)
-        VALUES (?, ?, ?, ?, ?)
+        Args:
+            sector_data (List[Dict]): List of sector performance records
+            mode (str): 'replace' overwrites rows with the same key, 'append' does a plain INSERT
         """
+        cursor = self.connection.cursor()
+        
+        insert_sql = _insert_sql_for(INSERT_SECTOR_PERFORMANCE_SQL, mode)
         
         try:
-            for vol_record in volatility_data:
-                cursor.execute(insert_sql, (
-                    vol_record.get('underlying_symbol'),
-                    vol_record.get('volatility_type'),
-                    vol_record.get('date'),
-                    vol_record.get('volatility_value'),
-                    vol_record.get('volatility_period')
+            with self._transaction():
+                cursor.executemany(insert_sql, (
+                    (
+                        sector_record.get('sector'),
+                        sector_record.get('date'),
+                        sector_record.get('number_of_assets'),
+                        sector_record.get('total_market_cap'),
+                        sector_record.get('avg_pe_ratio'),
+                        sector_record.get('avg_dividend_yield')
+                    )
+                    for sector_record in sector_data
                 ))
             
-            self.connection.commit()
-            print(f"Inserted {len(volatility_data)} volatility records")
+            logger.debug(f"Inserted {len(sector_data)} sector performance records")
             
         except sqlite3.Error as e:
-            print(f"Error inserting volatility data: {e}")
+            if self._atomic:
+                raise
+            logger.error(f"Error inserting sector performance data: {e}")
     
     def get_asset_symbols(self, asset_type: str = None) -> List[str]:
         """Get asset symbols, optionally filtered by type"""
-        if not self.connection:
-            self.connect()
-        
-        cursor = self.connection.cursor()
+        cursor = self._cursor
         
         if asset_type:
             cursor.execute("SELECT symbol FROM assets WHERE is_active = TRUE AND asset_type = ?", (asset_type,))
@@ -356,70 +881,98 @@ class FinancialDatabase:
     
     def get_latest_price_date(self, symbol: str) -> Optional[str]:
         """Get the latest date for a specific symbol in daily_prices"""
-        if not self.connection:
-            self.connect()
-        
-        cursor = self.connection.cursor()
-        cursor.execute("SELECT MAX(date) FROM daily_prices WHERE symbol = ?", (symbol,))
-        result = cursor.fetchone()
-        return result[0] if result[0] else None
+        return self.execute_scalar(LATEST_PRICE_DATE_SQL, (symbol,)) or None
     
     def get_asset_overview(self, symbol: str) -> Dict[str, Any]:
         """Get complete asset overview from the assets table"""
-        if not self.connection:
-            self.connect()
-        
-        cursor = self.connection.cursor()
-        cursor.execute("SELECT * FROM assets WHERE symbol = ?", (symbol,))
-        result = cursor.fetchone()
+        result = self._cursor.execute(ASSET_OVERVIEW_SQL, (symbol,)).fetchone()
         
         if result:
-            columns = [description[0] for description in cursor.description]
-            return dict(zip(columns, result))
+            if self._asset_columns is None:
+                self._asset_columns = [row[1] for row in self._cursor.execute("PRAGMA table_info(assets)")]
+            return dict(zip(self._asset_columns, result))
         return {}
     
-    def execute_query(self, query: str, params: tuple = None) -> pd.DataFrame:
+    def execute_scalar(self, query: str, params: tuple = None) -> Any:
         """
-        Execute a SQL query and return results as DataFrame
+        Execute a SQL query and return the first column of the first row
         
         Args:
             query (str): SQL query to execute
             params (tuple): Parameters for the query
         
         Returns:
-            pd.DataFrame: Query results
+            Any: The value, or None if the query returned no rows
         """
-        if not self.connection:
-            self.connect()
+        try:
+            row = self._cursor.execute(query, params or ()).fetchone()
+            return row[0] if row else None
+        except sqlite3.Error as e:
+            print(f"Error executing query: {e}")
+            return None
+    
+    def execute_rows(self, query: str, params: tuple = None) -> List[tuple]:
+        """
+        Execute a SQL query and return all rows as plain tuples
+        
+        Args:
+            query (str): SQL query to execute
+            params (tuple): Parameters for the query
         
+        Returns:
+            List[tuple]: Result rows
+        """
         try:
-            if params:
-                return pd.read_sql_query(query, self.connection, params=params)
-            else:
-                return pd.read_sql_query(query, self.connection)
+            return self._cursor.execute(query, params or ()).fetchall()
+        except sqlite3.Error as e:
+            print(f"Error executing query: {e}")
+            return []
+    
+    def execute_df(self, query: str, params: tuple = None, chunksize: int = None):
+        """
+        Execute a SQL query and return results as DataFrame
+        
+        Args:
+            query (str): SQL query to execute
+            params (tuple): Parameters for the query
+            chunksize (int): If set, stream the result as an iterator of DataFrames with
+                             this many rows each (bounds memory for large analytical queries)
+        
+        Returns:
+            pd.DataFrame or Iterator[pd.DataFrame]: Query results
+        """
+        try:
+            return pd.read_sql_query(query, self.connection, params=params, chunksize=chunksize)
         except Exception as e:
             print(f"Error executing query: {e}")
-            return pd.DataFrame()
+            return iter(()) if chunksize else pd.DataFrame()
+    
+    def execute_query(self, query: str, params: tuple = None) -> pd.DataFrame:
+        """
+        Execute a SQL query and return results as DataFrame
+        
+        Args:
+            query (str): SQL query to execute
+            params (tuple): Parameters for the query
+        
+        Returns:
+            pd.DataFrame: Query results
+        """
+        return self.execute_df(query, params)
     
     def get_data_summary(self):
         """Print a comprehensive summary of data in the database"""
-        if not self.connection:
-            self.connect()
-        
         print("\n=== FINANCIAL MARKETS DATABASE SUMMARY ===")
         
+        cursor = self._cursor
+        
         # Count records in each table
-        tables = ['assets', 'daily_prices', 'economic_indicators', 
-                 'sector_performance', 'market_indices', 'volatility_data']
-        for table in tables:
-            cursor = self.connection.cursor()
-            cursor.execute(f"SELECT COUNT(*) FROM {table}")
-            count = cursor.fetchone()[0]
+        counts = cursor.execute(COUNT_TABLES_SQL).fetchone()
+        for table, count in zip(SUMMARY_TABLES, counts):
             print(f"{table}: {count:,} records")
         
         # Asset breakdown by type
         print("\n=== ASSET BREAKDOWN ===")
-        cursor = self.connection.cursor()
         cursor.execute("""
             SELECT asset_type, COUNT(*) as count, 
                    SUM(market_capitalization) as total_market_cap
@@ -463,8 +1016,8 @@ def setup_database():
 
     # Initialize database
     db = FinancialDatabase(db_path="database_and_schema/financial_markets.db")
-    db.connect()
-    db.create_database(schema_file='database_and_schema/schema.sql')
+    with db.bulk_load():
+        db.create_database(schema_file='database_and_schema/schema.sql')
     
     print("\nDatabase created and connection established.")
     print("\n=== NEXT STEPS ===")
@@ -3,19 +3,156 @@ Financial Data Pipeline - Main Orchestrator
 Combines data collection and database operations using both modules
 """
 
+import asyncio
 import logging
-from datetime import datetime
-from typing import List, Tuple, Dict, Any
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from typing import List, Tuple, Dict, Any, Optional
 import pandas as pd
 
 # Import our modules
 from data_setup.components.database_config import FinancialDatabase
-from data_setup.components.data_collection_config import FinancialDataCollector
+from data_setup.components.data_collection_config import YF_BATCH_SIZE, FinancialDataCollector
+
+try:
+    import uvloop  # Optional: libuv-based event loop with cheaper socket I/O (Linux/macOS only)
+except ImportError:
+    uvloop = None
+
+# Concurrent requests in flight per API when collecting asynchronously; Alpha Vantage calls get
+# their own worker threads, since they block in the collector's rate limiter
+AV_MAX_CONCURRENCY = 5
+YF_MAX_CONCURRENCY = 20
+
+# Worker threads fetching FRED series in parallel
+FRED_MAX_WORKERS = 8
+
+# Assets written within the last day whose latest price bar is under a week old (covers weekends
+# and market holidays) are considered fresh and not collected again; an asset row written by a run
+# whose price download failed does not count
+FRESH_ASSET_SQL = """
+    SELECT 1 FROM assets a
+    WHERE a.symbol = ? AND a.last_updated > datetime('now', '-1 day')
+      AND (SELECT MAX(p.date) FROM daily_prices p WHERE p.symbol = a.symbol) >= date('now', '-7 days')
+"""
+
+# Last year of stored closes for a symbol, for volatility of assets that were not re-downloaded
+RECENT_CLOSES_SQL = """
+    SELECT symbol, date, close_price FROM daily_prices
+    WHERE symbol = ? AND date >= date((SELECT MAX(date) FROM daily_prices WHERE symbol = ?), '-1 year')
+    ORDER BY date
+"""
+
+# Fields of the economic indicator records passed to FinancialDatabase.insert_economic_indicators
+ECONOMIC_RECORD_COLUMNS = ['indicator_name', 'indicator_code', 'date', 'value', 'unit', 'frequency', 'source']
+
+# assets columns aggregated per sector by update_sector_performance
+SECTOR_METRIC_COLUMNS = ['market_capitalization', 'pe_ratio', 'dividend_yield']
+
+# Fields of the volatility records passed to FinancialDatabase.insert_volatility_data
+VOLATILITY_RECORD_COLUMNS = ['underlying_symbol', 'volatility_type', 'date', 'volatility_value', 'volatility_period']
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+def _event_loop_running() -> bool:
+    """True when called from inside a running asyncio event loop (e.g. Jupyter)"""
+    try:
+        asyncio.get_running_loop()
+        return True
+    except RuntimeError:
+        return False
+
+
+def _nan_to_none(values):
+    """Object-dtype copy of a Series/DataFrame with NaN/NaT masked to None, so records carry SQL NULLs"""
+    return values.astype(object).where(values.notna(), None)
+
+
+# Placeholders Alpha Vantage uses for missing values
+_AV_NULLS = frozenset({'None', '-', 'N/A', '', None})
+
+
+def _identity(value):
+    return value
+
+
+def _clean_numeric(value) -> Optional[float]:
+    """Alpha Vantage numeric string -> float (None for placeholders and junk)"""
+    if value in _AV_NULLS:
+        return None
+    try:
+        number = float(value)
+    except (ValueError, TypeError):
+        return None
+    # 'NaN' parses to a float NaN, which fails self-equality
+    return number if number == number else None
+
+
+def _clean_date(value) -> Optional[date]:
+    """Alpha Vantage YYYY-MM-DD string -> date (None for placeholders and junk)"""
+    if value in _AV_NULLS:
+        return None
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    except (ValueError, TypeError):
+        return None
+
+
+# (OVERVIEW key, cleaner, default) for every field mapped from an Alpha Vantage overview
+# (AssetType is added per call since its default is the requested asset type)
+_AV_FIELDS = (
+    ('Symbol', _identity, None),
+    ('Name', _identity, None),
+    ('Description', _identity, None),
+    ('CIK', _identity, None),
+    ('Exchange', _identity, None),
+    ('Currency', _identity, 'USD'),
+    ('Country', _identity, None),
+    ('Sector', _identity, None),
+    ('Industry', _identity, None),
+    ('MarketCapitalization', _clean_numeric, None),
+    ('EBITDA', _clean_numeric, None),
+    ('PERatio', _clean_numeric, None),
+    ('PEGRatio', _clean_numeric, None),
+    ('BookValue', _clean_numeric, None),
+    ('DividendPerShare', _clean_numeric, None),
+    ('DividendYield', _clean_numeric, None),
+    ('EPS', _clean_numeric, None),
+    ('RevenuePerShareTTM', _clean_numeric, None),
+    ('ProfitMargin', _clean_numeric, None),
+    ('OperatingMarginTTM', _clean_numeric, None),
+    ('ReturnOnAssetsTTM', _clean_numeric, None),
+    ('ReturnOnEquityTTM', _clean_numeric, None),
+    ('RevenueTTM', _clean_numeric, None),
+    ('GrossProfitTTM', _clean_numeric, None),
+    ('DilutedEPSTTM', _clean_numeric, None),
+    ('QuarterlyEarningsGrowthYOY', _clean_numeric, None),
+    ('QuarterlyRevenueGrowthYOY', _clean_numeric, None),
+    ('AnalystTargetPrice', _clean_numeric, None),
+    ('TrailingPE', _clean_numeric, None),
+    ('ForwardPE', _clean_numeric, None),
+    ('PriceToSalesRatioTTM', _clean_numeric, None),
+    ('PriceToBookRatio', _clean_numeric, None),
+    ('EVToRevenue', _clean_numeric, None),
+    ('EVToEBITDA', _clean_numeric, None),
+    ('Beta', _clean_numeric, None),
+    ('52WeekHigh', _clean_numeric, None),
+    ('52WeekLow', _clean_numeric, None),
+    ('50DayMovingAverage', _clean_numeric, None),
+    ('200DayMovingAverage', _clean_numeric, None),
+    ('SharesOutstanding', _clean_numeric, None),
+    ('DividendDate', _clean_date, None),
+    ('ExDividendDate', _clean_date, None),
+)
+
+# Columns cleaned in bulk by _map_alpha_vantage_to_asset_batch
+_AV_NUMERIC_FIELDS = [key for key, clean, _ in _AV_FIELDS if clean is _clean_numeric]
+_AV_DATE_FIELDS = [key for key, clean, _ in _AV_FIELDS if clean is _clean_date]
+
+
 class FinancialDataPipeline:
     """
     Main orchestrator that combines data collection and database operations
@@ -32,11 +169,11 @@ class FinancialDataPipeline:
             alpha_vantage_key (str): Alpha Vantage API key
             fred_api_key (str): FRED API key
         """
-        self.db = FinancialDatabase(db_path)
+        self.db = FinancialDatabase(db_path)  # Connects on construction
         self.collector = FinancialDataCollector(alpha_vantage_key, fred_api_key)
         
-        # Connect to database
-        self.db.connect()
+        # Event loop kept for the pipeline's lifetime and reused by every collection run
+        self._loop = None
         
         logger.info("Financial Data Pipeline initialized")
     
@@ -51,19 +188,26 @@ class FinancialDataPipeline:
         self.db.create_database(schema_file)
         logger.info("Database setup complete")
     
-    def collect_and_insert_asset(self, symbol: str, asset_type: str = "Stock") -> bool:
+    def collect_and_insert_asset(self, symbol: str, asset_type: str = "Stock", force_refresh: bool = False,
+                                 include_volatility: bool = False, price_data: pd.DataFrame = None) -> bool:
         """
         Collect comprehensive asset data and insert into database
         
         Args:
             symbol (str): Stock symbol
             asset_type (str): Type of asset (Stock, ETF, etc.)
+            force_refresh (bool): Collect even if the asset was updated within the last day
+            include_volatility (bool): Also derive realized volatility from the downloaded prices
+            price_data (pd.DataFrame): 2y prices already fetched in a batch (downloaded here if None)
             
         Returns:
-            bool: Success status
+            bool: Success status (True without any API calls or volatility work when the asset is fresh)
         """
+        if not force_refresh and self._is_fresh(symbol):
+            logger.info(f"Skipping {symbol}: updated within the last day")
+            return True
+        
         logger.info(f"Processing asset: {symbol} ({asset_type})")
-        success = False
         
         # Step 1: Collect Alpha Vantage overview data
         overview_data = self.collector.get_asset_overview_alpha_vantage(symbol)
@@ -72,35 +216,99 @@ class FinancialDataPipeline:
         yf_info = self.collector.get_asset_info_yfinance(symbol)
         
         # Step 3: Prepare asset data for insertion
+        asset_data = self._prepare_asset_data(symbol, asset_type, overview_data, yf_info)
+        
+        # Step 4: Collect price data, unless the batch download already did
+        if price_data is None:
+            price_data = self.collector.get_price_data_yfinance(symbol, period="2y")
+        
+        # Step 5: Volatility from the same 2y frame (sliced to a year), no second download
+        volatility_records = []
+        if include_volatility and price_data is not None:
+            volatility_records = self._build_volatility_records(symbol, price_data)
+        
+        # Step 6: Write everything for the symbol in one transaction
+        return self._write_asset(symbol, asset_data, price_data, volatility_records)
+    
+    def _prepare_asset_data(self, symbol: str, asset_type: str, overview_data: Optional[Dict],
+                            yf_info: Optional[Dict]) -> Dict:
+        """Asset row from the Alpha Vantage overview (primary source), else yfinance info, else a minimal row"""
         if overview_data:
-            # Use Alpha Vantage data (primary source)
-            asset_data = self._map_alpha_vantage_to_asset(overview_data, asset_type)
-        elif yf_info:
-            # Fallback to yfinance data
-            asset_data = self._map_yfinance_to_asset(symbol, yf_info, asset_type)
-        else:
-            logger.warning(f"No asset overview data found for {symbol}")
-            asset_data = self._create_minimal_asset(symbol, asset_type)
+            return self._map_alpha_vantage_to_asset(overview_data, asset_type)
+        if yf_info:
+            return self._map_yfinance_to_asset(symbol, yf_info, asset_type)
         
-        # Step 4: Insert asset data using database module
+        logger.warning(f"No asset overview data found for {symbol}")
+        return self._create_minimal_asset(symbol, asset_type)
+    
+    def _write_asset(self, symbol: str, asset_data: Dict, price_data: Optional[pd.DataFrame],
+                     volatility_records: List[Dict[str, Any]]) -> bool:
+        """
+        Write a symbol's asset row, prices and volatility in one transaction
+        
+        Runs after every network fetch, so the write lock is only held for the inserts.
+        Either all of the symbol's rows are committed or, if any insert fails, none are.
+        
+        Returns:
+            bool: Success status
+        """
         try:
-            self.db.insert_asset(asset_data)
-            logger.info(f"✓ Inserted asset overview for {symbol}")
-            success = True
+            with self.db.transaction():
+                self.db.insert_asset(asset_data)
+                if price_data is not None:
+                    # Streamed in PRICE_INSERT_CHUNK_SIZE chunks; log progress per flushed chunk
+                    self.db.insert_daily_prices(
+                        price_data, symbol,
+                        callback=lambda rows: logger.debug(f"{symbol}: wrote {rows} price rows")
+                    )
+                if volatility_records:
+                    self.db.insert_volatility_data(volatility_records)
         except Exception as e:
-            logger.error(f"✗ Error inserting asset data for {symbol}: {e}")
+            logger.error(f"✗ Error inserting data for {symbol} (nothing written): {e}")
+            return False
         
-        # Step 5: Collect and insert price data
-        price_data = self.collector.get_price_data_yfinance(symbol, period="2y")
+        logger.info(f"✓ Inserted asset overview for {symbol}")
         if price_data is not None:
-            try:
-                self.db.insert_daily_prices(price_data, symbol)
-                logger.info(f"✓ Inserted {len(price_data)} price records for {symbol}")
-                success = True
-            except Exception as e:
-                logger.error(f"✗ Error inserting price data for {symbol}: {e}")
+            logger.info(f"✓ Inserted {len(price_data)} price records for {symbol}")
+        if volatility_records:
+            logger.info(f"✓ Inserted {len(volatility_records)} volatility records for {symbol}")
+        return True
+    
+    def collect_and_insert_asset_overviews(self, symbols: List[str], asset_type: str = "Stock") -> int:
+        """
+        Backfill asset overviews for many symbols with one batched upsert
+        
+        Overviews are fetched under the collector's Alpha Vantage rate limit, cleaned
+        together as one DataFrame and written in a single transaction. Price history
+        is not collected here.
         
-        return success
+        Args:
+            symbols (List[str]): Stock symbols
+            asset_type (str): Asset type for overviews that do not report one
+            
+        Returns:
+            int: Number of assets upserted
+        """
+        logger.info(f"Collecting asset overviews for {len(symbols)} symbols...")
+        
+        # The collector paces Alpha Vantage itself, so no extra delay between calls
+        overviews = self.collector.batch_collect_with_delay(
+            symbols, self.collector.get_asset_overview_alpha_vantage, delay=0
+        )
+        found = [overview for overview in overviews.values() if overview]
+        
+        if not found:
+            logger.warning("No asset overviews collected")
+            return 0
+        
+        try:
+            assets_df = self._map_alpha_vantage_to_asset_batch(found, asset_type)
+            self.db.upsert_assets_batch(assets_df.to_dict('records'))
+            logger.info(f"✓ Upserted {len(found)}/{len(symbols)} asset overviews")
+            return len(found)
+        except Exception as e:
+            logger.error(f"✗ Error upserting asset overviews: {e}")
+            return 0
     
     def collect_and_insert_economic_indicators(self):
         """
@@ -111,22 +319,24 @@ class FinancialDataPipeline:
         indicators = self.collector.get_fred_indicators()
         indicator_records = []
         
-        for series_id, metadata in indicators.items():
-            # Collect data
-            fred_data = self.collector.get_fred_economic_data(series_id)
-            
+        # Fetch every series concurrently; each call is one FRED round trip
+        with ThreadPoolExecutor(max_workers=FRED_MAX_WORKERS) as executor:
+            fred_results = list(executor.map(self.collector.get_fred_economic_data, indicators))
+        
+        for (series_id, metadata), fred_data in zip(indicators.items(), fred_results):
             if fred_data is not None:
-                # Convert to format expected by database
-                for _, row in fred_data.iterrows():
-                    indicator_records.append({
-                        'indicator_name': metadata['name'],
-                        'indicator_code': series_id,
-                        'date': row['date'].strftime('%Y-%m-%d'),
-                        'value': float(row['value']) if pd.notnull(row['value']) else None,
-                        'unit': metadata['unit'],
-                        'frequency': metadata['frequency'],
-                        'source': metadata['source']
-                    })
+                # Convert to format expected by database, whole columns at a time
+                fred_data = fred_data.assign(
+                    indicator_name=metadata['name'],
+                    indicator_code=series_id,
+                    date=fred_data['date'].dt.strftime('%Y-%m-%d'),
+                    value=pd.to_numeric(fred_data['value'], errors='coerce'),
+                    unit=metadata['unit'],
+                    frequency=metadata['frequency'],
+                    source=metadata['source']
+                )
+                fred_data['value'] = _nan_to_none(fred_data['value'])
+                indicator_records.extend(fred_data[ECONOMIC_RECORD_COLUMNS].to_dict('records'))
         
         # Insert using database module
         if indicator_records:
@@ -138,40 +348,125 @@ class FinancialDataPipeline:
         else:
             logger.warning("No economic indicator data collected")
     
-    def collect_and_insert_volatility_data(self, symbol: str):
+    def collect_and_insert_volatility_data(self, symbol: str, price_data: pd.DataFrame = None):
         """
         Collect and insert volatility data for a symbol
         
         Args:
             symbol (str): Stock symbol
+            price_data (pd.DataFrame): Standardized price frame to use instead of fetching
+        """
+        volatility_records = self._build_volatility_records(symbol, price_data)
+        
+        if volatility_records:
+            self._insert_volatility_records(symbol, volatility_records)
+    
+    def _build_volatility_records(self, symbol: str, price_data: pd.DataFrame = None) -> List[Dict[str, Any]]:
+        """
+        Compute realized volatility records for a symbol over the last year of prices
+        
+        Slices `price_data` (e.g. the 2y frame collect_and_insert_asset just downloaded) to
+        its last year. Without a frame, a fresh asset's stored prices are read back from
+        daily_prices, and only other symbols download a year of prices.
+        
+        Args:
+            symbol (str): Stock symbol
+            price_data (pd.DataFrame): Standardized price frame to use instead of fetching
+            
+        Returns:
+            List[Dict]: Records in the format expected by insert_volatility_data
         """
         logger.info(f"Collecting volatility data for {symbol}...")
         
         # Get price data for volatility calculation
-        price_data = self.collector.get_price_data_yfinance(symbol, period="1y")
+        if price_data is not None:
+            dates = price_data['date']
+            price_data = price_data[dates >= dates.max() - pd.DateOffset(years=1)]
+        elif self._is_fresh(symbol):
+            price_data = self.db.execute_query(RECENT_CLOSES_SQL, (symbol, symbol))
+        else:
+            price_data = self.collector.get_price_data_yfinance(symbol, period="1y")
         
+        volatility_records = []
         if price_data is not None:
             # Calculate realized volatility
             volatility_df = self.collector.calculate_realized_volatility(price_data, window=30)
             
             if not volatility_df.empty:
-                # Convert to format expected by database
-                volatility_records = []
-                for _, row in volatility_df.iterrows():
-                    volatility_records.append({
-                        'underlying_symbol': row['symbol'],
-                        'volatility_type': row['volatility_type'],
-                        'date': row['date'].strftime('%Y-%m-%d'),
-                        'volatility_value': float(row['volatility_value']) if pd.notnull(row['volatility_value']) else None,
-                        'volatility_period': int(row['volatility_period'])
-                    })
-                
-                # Insert using database module
-                try:
-                    self.db.insert_volatility_data(volatility_records)
-                    logger.info(f"✓ Inserted {len(volatility_records)} volatility records for {symbol}")
-                except Exception as e:
-                    logger.error(f"✗ Error inserting volatility data for {symbol}: {e}")
+                # Convert to format expected by database, whole columns at a time
+                volatility_df = volatility_df.rename(columns={'symbol': 'underlying_symbol'}).assign(
+                    date=lambda d: pd.to_datetime(d['date']).dt.strftime('%Y-%m-%d'),
+                    volatility_value=lambda d: _nan_to_none(d['volatility_value']),
+                    volatility_period=lambda d: d['volatility_period'].astype(int)
+                )
+                volatility_records = volatility_df[VOLATILITY_RECORD_COLUMNS].to_dict('records')
+        
+        return volatility_records
+    
+    def _insert_volatility_records(self, symbol: str, volatility_records: List[Dict[str, Any]]):
+        """Insert volatility records for a symbol using the database module"""
+        try:
+            self.db.insert_volatility_data(volatility_records)
+            logger.info(f"✓ Inserted {len(volatility_records)} volatility records for {symbol}")
+        except Exception as e:
+            logger.error(f"✗ Error inserting volatility data for {symbol}: {e}")
+    
+    async def collect_and_insert_asset_async(self, symbol: str, asset_type: str, av_executor: ThreadPoolExecutor,
+                                             yf_semaphore: asyncio.Semaphore, db_lock: asyncio.Lock,
+                                             include_volatility: bool = False, price_data: pd.DataFrame = None):
+        """
+        Async version of collect_and_insert_asset
+        
+        Alpha Vantage goes through the collector's (cached) session on av_executor's threads,
+        where its rate limiter can sleep without holding up the default executor, and cache
+        hits skip the limit. The blocking yfinance calls run in the default executor, and
+        database writes are serialized through db_lock (one SQLite writer at a time).
+        
+        Args:
+            symbol (str): Stock symbol
+            asset_type (str): Type of asset (Stock, ETF, etc.)
+            av_executor (ThreadPoolExecutor): Threads running Alpha Vantage requests
+            yf_semaphore (asyncio.Semaphore): Bounds concurrent yfinance requests
+            db_lock (asyncio.Lock): Serializes database writes
+            include_volatility (bool): Also derive realized volatility from the downloaded prices
+            price_data (pd.DataFrame): 2y prices already fetched in a batch (downloaded here if None)
+            
+        Returns:
+            bool: Success status
+        """
+        logger.info(f"Processing asset: {symbol} ({asset_type})")
+        
+        # Step 1 & 2: Alpha Vantage overview and yfinance backup data, fetched concurrently
+        async def fetch_overview():
+            # Without a key there is no request to make, so don't queue behind the rate limit
+            if not self.collector.alpha_vantage_key:
+                return None
+            return await asyncio.get_running_loop().run_in_executor(
+                av_executor, self.collector.get_asset_overview_alpha_vantage, symbol
+            )
+        
+        async def fetch_yf_info():
+            async with yf_semaphore:
+                return await asyncio.to_thread(self.collector.get_asset_info_yfinance, symbol)
+        
+        overview_data, yf_info = await asyncio.gather(fetch_overview(), fetch_yf_info())
+        
+        # Step 3: Prepare asset data for insertion
+        asset_data = self._prepare_asset_data(symbol, asset_type, overview_data, yf_info)
+        
+        # Step 4: Collect price data, unless the batch download already did
+        if price_data is None:
+            async with yf_semaphore:
+                price_data = await asyncio.to_thread(self.collector.get_price_data_yfinance, symbol, "2y")
+        
+        # Step 5: Volatility from the same 2y frame; the frame is dropped once this returns
+        volatility_records = []
+        if include_volatility and price_data is not None:
+            volatility_records = await asyncio.to_thread(self._build_volatility_records, symbol, price_data)
+        
+        # Step 6: One worker call writes the symbol's rows in a single transaction
+        async with db_lock:
+            return await asyncio.to_thread(self._write_asset, symbol, asset_data, price_data, volatility_records)
     
     def update_sector_performance(self):
         """
@@ -179,65 +474,34 @@ class FinancialDataPipeline:
         """
         logger.info("Updating sector performance metrics...")
         
-        # Get sectors from database
-        sectors_query = "SELECT DISTINCT sector FROM assets WHERE sector IS NOT NULL AND sector != '' AND is_active = TRUE"
-        sectors_df = self.db.execute_query(sectors_query)
+        # One SELECT of the raw columns; the (small) assets table is aggregated in pandas
+        assets_df = self.db.execute_query("""
+            SELECT sector, market_capitalization, pe_ratio, dividend_yield
+            FROM assets 
+            WHERE is_active = TRUE AND sector IS NOT NULL AND sector != ''
+        """)
         
-        if sectors_df.empty:
+        if assets_df.empty:
             logger.warning("No sectors found in database")
             return
         
-        sector_records = []
-        today = datetime.now().strftime('%Y-%m-%d')
-        
-        for sector in sectors_df['sector'].unique():
-            # Calculate sector metrics
-            sector_query = """
-                SELECT 
-                    COUNT(*) as asset_count,
-                    SUM(market_capitalization) as total_market_cap,
-                    AVG(pe_ratio) as avg_pe_ratio,
-                    AVG(dividend_yield) as avg_dividend_yield
-                FROM assets 
-                WHERE sector = ? AND is_active = TRUE
-            """
-            
-            result = self.db.execute_query(sector_query, params=(sector,))
-            
-            if not result.empty:
-                row = result.iloc[0]
-                sector_records.append({
-                    'sector': sector,
-                    'date': today,
-                    'number_of_assets': int(row['asset_count']),
-                    'total_market_cap': int(row['total_market_cap']) if pd.notnull(row['total_market_cap']) else None,
-                    'avg_pe_ratio': float(row['avg_pe_ratio']) if pd.notnull(row['avg_pe_ratio']) else None,
-                    'avg_dividend_yield': float(row['avg_dividend_yield']) if pd.notnull(row['avg_dividend_yield']) else None
-                })
+        metrics = assets_df[SECTOR_METRIC_COLUMNS].apply(pd.to_numeric, errors='coerce')
+        grouped = metrics.groupby(assets_df['sector'], sort=False)
+        agg_df = pd.DataFrame({
+            'number_of_assets': grouped.size(),
+            # min_count=1 keeps SQL semantics: a sector with no market caps sums to NULL, not 0
+            'total_market_cap': grouped['market_capitalization'].sum(min_count=1).round().astype('Int64'),
+            'avg_pe_ratio': grouped['pe_ratio'].mean(),
+            'avg_dividend_yield': grouped['dividend_yield'].mean()
+        }).rename_axis('sector').reset_index()
+        agg_df['date'] = datetime.now().strftime('%Y-%m-%d')
         
-        # Insert using database module
+        sector_records = _nan_to_none(agg_df).to_dict('records')
+        
+        # Insert using database module (one executemany inside a single transaction)
         if sector_records:
-            # Convert to format for database insertion (sector_performance table doesn't have a direct insert method)
             try:
-                cursor = self.db.connection.cursor()
-                
-                insert_sql = """
-                INSERT OR REPLACE INTO sector_performance 
-                (sector, date, number_of_assets, total_market_cap, avg_pe_ratio, avg_dividend_yield)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """
-                
-                for record in sector_records:
-                    cursor.execute(insert_sql, (
-                        record['sector'],
-                        record['date'],
-                        record['number_of_assets'],
-                        record['total_market_cap'],
-                        record['avg_pe_ratio'],
-                        record['avg_dividend_yield']
-                    ))
-                
-                self.db.connection.commit()
+                self.db.insert_sector_performance(sector_records)
                 logger.info(f"✓ Updated sector performance for {len(sector_records)} sectors")
                 
             except Exception as e:
@@ -246,7 +510,7 @@ class FinancialDataPipeline:
     def run_comprehensive_collection(self, symbols_and_types: List[Tuple[str, str]], 
                                    include_economic_data: bool = True,
                                    include_volatility: bool = True,
-                                   delay: float = 12.0):
+                                   force_refresh: bool = False):
         """
         Run comprehensive data collection for multiple assets
         
@@ -254,30 +518,34 @@ class FinancialDataPipeline:
             symbols_and_types (List[Tuple[str, str]]): List of (symbol, asset_type) tuples
             include_economic_data (bool): Whether to collect economic indicators
             include_volatility (bool): Whether to calculate volatility data
-            delay (float): Delay between API calls (seconds)
+            force_refresh (bool): Re-collect assets that were already updated within the last day
+        
+        Alpha Vantage requests are paced by the collector's calls-per-minute limit
+        rather than a fixed delay between symbols.
         """
         logger.info(f"Starting comprehensive data collection for {len(symbols_and_types)} assets...")
         
-        successful_assets = 0
         total_assets = len(symbols_and_types)
         
-        # Collect asset data with rate limiting
-        for i, (symbol, asset_type) in enumerate(symbols_and_types):
-            logger.info(f"Processing asset {i+1}/{total_assets}: {symbol}")
-            
-            success = self.collect_and_insert_asset(symbol, asset_type)
-            if success:
-                successful_assets += 1
-                
-                # Collect volatility data if requested
-                if include_volatility:
-                    self.collect_and_insert_volatility_data(symbol)
-            
-            # Rate limiting (don't delay after last item)
-            if i < total_assets - 1 and delay > 0:
-                logger.info(f"Waiting {delay} seconds for rate limiting...")
-                import time
-                time.sleep(delay)
+        # Assets written within the last day with current prices keep their data; skip their API calls entirely
+        fresh_assets = 0
+        if not force_refresh:
+            stale = [(symbol, asset_type) for symbol, asset_type in symbols_and_types if not self._is_fresh(symbol)]
+            fresh_assets = total_assets - len(stale)
+            if fresh_assets:
+                logger.info(f"Skipping {fresh_assets} assets updated within the last day")
+            symbols_and_types = stale
+        
+        # Overlap per-symbol network I/O with asyncio (unless we are already inside an event
+        # loop, e.g. a notebook); otherwise go one by one. Each symbol's rows are written in
+        # one transaction once its fetches are done, so a failure part-way keeps the symbols
+        # already written and the write lock is never held across network calls
+        if not _event_loop_running():
+            successful_assets = self._run_async(
+                self._collect_assets_async(symbols_and_types, include_volatility)
+            )
+        else:
+            successful_assets = self._collect_assets_sequential(symbols_and_types, include_volatility)
         
         # Collect economic indicators if requested
         if include_economic_data:
@@ -286,13 +554,88 @@ class FinancialDataPipeline:
         # Update sector performance
         self.update_sector_performance()
         
+        successful_assets += fresh_assets
+        
         # Final summary
         logger.info(f"Collection complete: {successful_assets}/{total_assets} assets processed successfully")
         self.db.get_data_summary()
     
-    def run_quick_test(self):
+    def _collect_assets_sequential(self, symbols_and_types: List[Tuple[str, str]],
+                                   include_volatility: bool) -> int:
+        """
+        Collect assets one at a time (the collector rate-limits Alpha Vantage itself)
+        
+        Prices are downloaded YF_BATCH_SIZE symbols per request, one chunk at a time, so
+        only a chunk's frames are held in memory.
+        
+        Returns:
+            int: Number of assets processed successfully
+        """
+        successful_assets = 0
+        total_assets = len(symbols_and_types)
+        
+        # Collect asset data with rate limiting
+        for start in range(0, total_assets, YF_BATCH_SIZE):
+            chunk = symbols_and_types[start:start + YF_BATCH_SIZE]
+            prices = self.collector.get_price_data_yfinance_batch([symbol for symbol, _ in chunk], period="2y")
+            
+            for i, (symbol, asset_type) in enumerate(chunk, start + 1):
+                logger.info(f"Processing asset {i}/{total_assets}: {symbol}")
+                
+                # Freshness was already checked by run_comprehensive_collection; symbols missing
+                # from the batch download fall back to a per-symbol download
+                if self.collect_and_insert_asset(symbol, asset_type, force_refresh=True,
+                                                 include_volatility=include_volatility,
+                                                 price_data=prices.pop(symbol, None)):
+                    successful_assets += 1
+        
+        return successful_assets
+    
+    async def _collect_assets_async(self, symbols_and_types: List[Tuple[str, str]],
+                                    include_volatility: bool) -> int:
+        """
+        Collect all assets concurrently, bounded per API
+        
+        The Alpha Vantage calls-per-minute limit replaces the blanket sleep between
+        symbols, so yfinance downloads and database writes for other symbols
+        proceed while Alpha Vantage calls are spaced out. Prices are downloaded
+        YF_BATCH_SIZE symbols per request and symbols are processed one such chunk at a
+        time, so only a chunk's frames are held in memory.
+        
+        Returns:
+            int: Number of assets processed successfully
+        """
+        yf_semaphore = asyncio.Semaphore(YF_MAX_CONCURRENCY)
+        db_lock = asyncio.Lock()
+        
+        results = []
+        
+        with ThreadPoolExecutor(max_workers=AV_MAX_CONCURRENCY, thread_name_prefix='alpha-vantage') as av_executor:
+            for start in range(0, len(symbols_and_types), YF_BATCH_SIZE):
+                chunk = symbols_and_types[start:start + YF_BATCH_SIZE]
+                prices = await asyncio.to_thread(self.collector.get_price_data_yfinance_batch,
+                                                 [symbol for symbol, _ in chunk], "2y")
+                
+                # Symbols missing from the batch download fall back to a per-symbol download
+                results += await asyncio.gather(
+                    *(self.collect_and_insert_asset_async(symbol, asset_type, av_executor, yf_semaphore, db_lock,
+                                                          include_volatility, prices.pop(symbol, None))
+                      for symbol, asset_type in chunk),
+                    return_exceptions=True
+                )
+        
+        for (symbol, _), result in zip(symbols_and_types, results):
+            if isinstance(result, Exception):
+                logger.error(f"✗ Error processing {symbol}: {result}")
+        
+        return sum(1 for result in results if result is True)
+    
+    def run_quick_test(self, force_refresh: bool = False):
         """
         Run a quick test with a few symbols
+        
+        Args:
+            force_refresh (bool): Re-collect symbols already updated within the last day
         """
         test_symbols = [
             ('AAPL', 'Stock'),
@@ -305,79 +648,58 @@ class FinancialDataPipeline:
             test_symbols, 
             include_economic_data=False,  # Skip for quick test
             include_volatility=True,
-            delay=1.0  # Shorter delay for testing
+            force_refresh=force_refresh
         )
     
+    def _is_fresh(self, symbol: str) -> bool:
+        """True when the asset row was written within the last day and its prices are current"""
+        return self.db.execute_scalar(FRESH_ASSET_SQL, (symbol,)) is not None
+    
+    def _run_async(self, coro):
+        """Run a coroutine on the pipeline's event loop (uvloop when installed), creating it on first use"""
+        if self._loop is None:
+            self._loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
+    
     def close(self):
-        """Close database connection"""
+        """Close the HTTP session, the event loop and the database connection"""
+        if self._loop is not None:
+            self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+            self._loop.run_until_complete(self._loop.shutdown_default_executor())
+            self._loop.close()
+            self._loop = None
+        
+        self.collector.close()
         self.db.close()
     
     # Helper methods for data mapping
     def _map_alpha_vantage_to_asset(self, overview_data: Dict, asset_type: str) -> Dict:
         """Map Alpha Vantage data to asset dictionary for database insertion"""
+        asset = {key: clean(overview_data.get(key, default)) for key, clean, default in _AV_FIELDS}
+        asset['AssetType'] = overview_data.get('AssetType', asset_type)
+        return asset
+    
+    def _map_alpha_vantage_to_asset_batch(self, overviews: List[Dict], asset_type: str) -> pd.DataFrame:
+        """
+        Map many Alpha Vantage overviews at once, cleaning whole columns with pandas
         
-        def clean_numeric(value):
-            if value in ['None', '-', 'N/A', '', None]:
-                return None
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                return None
+        Args:
+            overviews (List[Dict]): Raw OVERVIEW payloads
+            asset_type (str): Asset type for overviews that do not report one
+            
+        Returns:
+            pd.DataFrame: One row per overview with _map_alpha_vantage_to_asset's keys (None for missing)
+        """
+        df = pd.DataFrame(overviews).reindex(columns=[key for key, _, _ in _AV_FIELDS] + ['AssetType'])
         
-        def clean_date(value):
-            if value and value != 'None':
-                try:
-                    from datetime import datetime
-                    return datetime.strptime(value, '%Y-%m-%d').date()
-                except ValueError:
-                    return None
-            return None
+        # Placeholders ('None', '-', ...) and junk coerce to NaN/NaT
+        df[_AV_NUMERIC_FIELDS] = df[_AV_NUMERIC_FIELDS].apply(pd.to_numeric, errors='coerce')
+        for column in _AV_DATE_FIELDS:
+            df[column] = pd.to_datetime(df[column], format='%Y-%m-%d', errors='coerce').dt.date
         
-        return {
-            'Symbol': overview_data.get('Symbol'),
-            'Name': overview_data.get('Name'),
-            'Description': overview_data.get('Description'),
-            'CIK': overview_data.get('CIK'),
-            'Exchange': overview_data.get('Exchange'),
-            'Currency': overview_data.get('Currency', 'USD'),
-            'Country': overview_data.get('Country'),
-            'Sector': overview_data.get('Sector'),
-            'Industry': overview_data.get('Industry'),
-            'AssetType': overview_data.get('AssetType', asset_type),
-            'MarketCapitalization': clean_numeric(overview_data.get('MarketCapitalization')),
-            'EBITDA': clean_numeric(overview_data.get('EBITDA')),
-            'PERatio': clean_numeric(overview_data.get('PERatio')),
-            'PEGRatio': clean_numeric(overview_data.get('PEGRatio')),
-            'BookValue': clean_numeric(overview_data.get('BookValue')),
-            'DividendPerShare': clean_numeric(overview_data.get('DividendPerShare')),
-            'DividendYield': clean_numeric(overview_data.get('DividendYield')),
-            'EPS': clean_numeric(overview_data.get('EPS')),
-            'RevenuePerShareTTM': clean_numeric(overview_data.get('RevenuePerShareTTM')),
-            'ProfitMargin': clean_numeric(overview_data.get('ProfitMargin')),
-            'OperatingMarginTTM': clean_numeric(overview_data.get('OperatingMarginTTM')),
-            'ReturnOnAssetsTTM': clean_numeric(overview_data.get('ReturnOnAssetsTTM')),
-            'ReturnOnEquityTTM': clean_numeric(overview_data.get('ReturnOnEquityTTM')),
-            'RevenueTTM': clean_numeric(overview_data.get('RevenueTTM')),
-            'GrossProfitTTM': clean_numeric(overview_data.get('GrossProfitTTM')),
-            'DilutedEPSTTM': clean_numeric(overview_data.get('DilutedEPSTTM')),
-            'QuarterlyEarningsGrowthYOY': clean_numeric(overview_data.get('QuarterlyEarningsGrowthYOY')),
-            'QuarterlyRevenueGrowthYOY': clean_numeric(overview_data.get('QuarterlyRevenueGrowthYOY')),
-            'AnalystTargetPrice': clean_numeric(overview_data.get('AnalystTargetPrice')),
-            'TrailingPE': clean_numeric(overview_data.get('TrailingPE')),
-            'ForwardPE': clean_numeric(overview_data.get('ForwardPE')),
-            'PriceToSalesRatioTTM': clean_numeric(overview_data.get('PriceToSalesRatioTTM')),
-            'PriceToBookRatio': clean_numeric(overview_data.get('PriceToBookRatio')),
-            'EVToRevenue': clean_numeric(overview_data.get('EVToRevenue')),
-            'EVToEBITDA': clean_numeric(overview_data.get('EVToEBITDA')),
-            'Beta': clean_numeric(overview_data.get('Beta')),
-            '52WeekHigh': clean_numeric(overview_data.get('52WeekHigh')),
-            '52WeekLow': clean_numeric(overview_data.get('52WeekLow')),
-            '50DayMovingAverage': clean_numeric(overview_data.get('50DayMovingAverage')),
-            '200DayMovingAverage': clean_numeric(overview_data.get('200DayMovingAverage')),
-            'SharesOutstanding': clean_numeric(overview_data.get('SharesOutstanding')),
-            'DividendDate': clean_date(overview_data.get('DividendDate')),
-            'ExDividendDate': clean_date(overview_data.get('ExDividendDate'))
-        }
+        df['Currency'] = df['Currency'].fillna('USD')
+        df['AssetType'] = df['AssetType'].fillna(asset_type)
+        return _nan_to_none(df)
     
     def _map_yfinance_to_asset(self, symbol: str, info: Dict, asset_type: str) -> Dict:
         """Map yfinance data to asset dictionary for database insertion"""
@@ -453,7 +775,7 @@ def create_collection_plan():
     
     print(f"\n💡 Tips:")
     print(f"   • Respects Alpha Vantage free tier (25 calls/day)")
-    print(f"   • Use delay=12 seconds between API calls")
+    print(f"   • Alpha Vantage calls are paced at 5 per minute automatically")
     print(f"   • Total dataset: ~35+ assets with comprehensive data")
     print(f"   • Perfect for portfolio analysis and Tableau dashboards")
     print("=" * 80)
@@ -557,7 +879,6 @@ def run_custom_collection():
                   f"Market Cap: ${asset_info.get('market_capitalization', 0)/1e9:.1f}B")
         
         # Small delay between assets
-        import time
         time.sleep(2)
     
     # Update sector performance
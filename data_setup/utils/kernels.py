@@ -0,0 +1,138 @@
+"""
+Numeric Kernels for Financial Time Series
+JIT-compiled with Numba when it is installed, plain Python loops otherwise
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit so kernels stay importable without Numba"""
+        def decorator(func):
+            return func
+        return decorator
+
+# Below this many elements the NumPy equivalent beats a kernel call: even with cache=True the
+# first call in a process pays for loading and type-dispatching the compiled kernel
+NUMBA_MIN_SIZE = 1000
+
+# fastmath flags without 'nnan'/'ninf' so the kernels' NaN checks are not optimized away
+FASTMATH_FLAGS = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+
+@njit(parallel=True, fastmath=FASTMATH_FLAGS, cache=True)
+def rolling_std(values, window):
+    """
+    Rolling sample standard deviation (ddof=1) down each column of a 2-D array
+
+    Keeps a running sum and sum of squares per column, adding the value entering
+    the window and subtracting the one leaving it, so each column is a single O(T)
+    pass. Columns are processed in parallel. Matches pandas rolling(window).std():
+    NaN until the window holds `window` valid values.
+
+    Args:
+        values (np.ndarray): (T, N) float64 array, e.g. daily returns per symbol
+        window (int): Rolling window length
+
+    Returns:
+        np.ndarray: (T, N) rolling standard deviations
+    """
+    n_rows, n_cols = values.shape
+    out = np.full((n_rows, n_cols), np.nan)
+
+    for j in prange(n_cols):
+        total = 0.0
+        total_sq = 0.0
+        n_valid = 0
+
+        for i in range(n_rows):
+            value = values[i, j]
+            if not np.isnan(value):
+                total += value
+                total_sq += value * value
+                n_valid += 1
+
+            if i >= window:
+                old = values[i - window, j]
+                if not np.isnan(old):
+                    total -= old
+                    total_sq -= old * old
+                    n_valid -= 1
+
+            if n_valid == window:
+                variance = (total_sq - total * total / window) / (window - 1)
+                out[i, j] = np.sqrt(variance) if variance > 0.0 else 0.0
+
+    return out
+
+
+@njit(fastmath=FASTMATH_FLAGS, cache=True)
+def realized_vol_from_prices(prices, window):
+    """
+    Annualized rolling volatility of simple returns, computed straight from prices
+
+    Fuses pct_change -> rolling std (ddof=1) -> * sqrt(252) into one pass: each
+    return is derived on the fly, and the one leaving the window is recomputed from
+    prices rather than stored, so no intermediate arrays are allocated.
+
+    Args:
+        prices (np.ndarray): 1-D close prices
+        window (int): Rolling window length (in returns)
+
+    Returns:
+        np.ndarray: Volatility aligned with `prices`; NaN until a full window of returns
+    """
+    n = prices.size
+    out = np.full(n, np.nan)
+    annualize = np.sqrt(252.0)
+    total = 0.0
+    total_sq = 0.0
+    n_valid = 0
+
+    for i in range(1, n):
+        ret = prices[i] / prices[i - 1] - 1.0
+        if not np.isnan(ret):
+            total += ret
+            total_sq += ret * ret
+            n_valid += 1
+
+        if i > window:
+            old = prices[i - window] / prices[i - window - 1] - 1.0
+            if not np.isnan(old):
+                total -= old
+                total_sq -= old * old
+                n_valid -= 1
+
+        if n_valid == window:
+            variance = (total_sq - total * total / window) / (window - 1)
+            out[i] = np.sqrt(variance) * annualize if variance > 0.0 else 0.0
+
+    return out
+
+
+@njit(fastmath=FASTMATH_FLAGS, cache=True)
+def simple_returns(prices):
+    """
+    Simple period-over-period returns of a 1-D price series
+
+    Args:
+        prices (np.ndarray): 1-D float64 prices in date order
+
+    Returns:
+        np.ndarray: Returns aligned with `prices`; NaN for the first element
+    """
+    out = np.empty_like(prices)
+    if prices.size == 0:
+        return out
+
+    out[0] = np.nan
+    for i in range(1, prices.size):
+        out[i] = prices[i] / prices[i - 1] - 1.0
+
+    return out
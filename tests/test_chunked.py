@@ -0,0 +1,76 @@
+"""
+Tests for data_setup.components.chunked.ChunkedInsert
+"""
+
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from data_setup.components.chunked import ChunkedInsert
+from data_setup.components.database_config import FinancialDatabase
+
+
+class ChunkedInsertTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db = FinancialDatabase(os.path.join(self.tmpdir.name, 'chunked.db'))
+        self.db.connection.execute("CREATE TABLE t (a INTEGER, b TEXT)")
+
+    def tearDown(self):
+        self.db.close()
+        self.tmpdir.cleanup()
+
+    def count(self):
+        return self.db.execute_scalar("SELECT COUNT(*) FROM t")
+
+    def test_commits_all_chunks(self):
+        flushed = []
+        with ChunkedInsert(self.db, 't', ('a', 'b'), chunksize=3, verb='INSERT INTO',
+                           callback=flushed.append, rows_per_statement=2) as ci:
+            for i in range(8):
+                ci.insert((i, str(i)))
+            ci.insert({'a': 8})
+
+        self.assertEqual(self.count(), 9)
+        self.assertEqual(flushed, [3, 6, 9])
+        self.assertIsNone(self.db.execute_scalar("SELECT b FROM t WHERE a = 8"))
+        self.assertFalse(self.db.connection.in_transaction)
+
+    def test_error_in_block_rolls_back_flushed_chunks(self):
+        with self.assertRaises(RuntimeError):
+            with ChunkedInsert(self.db, 't', ('a', 'b'), chunksize=2, verb='INSERT INTO') as ci:
+                ci.insert_many([(1, 'x'), (2, 'y'), (3, 'z')])
+                raise RuntimeError("boom")
+
+        self.assertEqual(self.count(), 0)
+        self.assertFalse(self.db.connection.in_transaction)
+
+    def test_failed_final_flush_rolls_back_flushed_chunks(self):
+        self.db.connection.execute("""
+            CREATE TRIGGER reject_three BEFORE INSERT ON t WHEN NEW.a = 3
+            BEGIN SELECT RAISE(ABORT, 'rejected'); END
+        """)
+
+        with self.assertRaises(sqlite3.IntegrityError):
+            with ChunkedInsert(self.db, 't', ('a', 'b'), chunksize=2, verb='INSERT INTO') as ci:
+                # Rows 1-2 are flushed inside the block; row 3 fails in the final flush on exit
+                ci.insert_many([(1, 'x'), (2, 'y'), (3, 'z')])
+
+        self.assertEqual(self.count(), 0)
+        self.assertFalse(self.db.connection.in_transaction)
+
+    def test_rows_per_statement_capped_by_variable_limit(self):
+        self.db.connection.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 10)
+
+        ci = ChunkedInsert(self.db, 't', ('a', 'b'), rows_per_statement=500)
+        self.assertEqual(ci.rows_per_statement, 5)
+
+        with ci:
+            ci.insert_many((i, str(i)) for i in range(12))
+        self.assertEqual(self.count(), 12)
+
+
+if __name__ == '__main__':
+    unittest.main()
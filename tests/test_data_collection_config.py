@@ -0,0 +1,126 @@
+"""
+Tests for the on-disk caches in data_setup.components.data_collection_config
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from data_setup.components import data_collection_config as dcc
+
+
+def _history(n: int = 5) -> pd.DataFrame:
+    """yfinance Ticker.history-shaped frame"""
+    index = pd.date_range('2024-01-01', periods=n, freq='B', name='Date')
+    close = np.linspace(100.0, 104.0, n)
+    return pd.DataFrame({'Open': close, 'High': close, 'Low': close, 'Close': close,
+                         'Volume': 1000, 'Dividends': 0.0, 'Stock Splits': 0.0}, index=index)
+
+
+class PriceCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        root = Path(self.tmpdir.name)
+        patches = [
+            mock.patch.object(dcc, 'PRICE_CACHE_DIR', root / 'prices'),
+            mock.patch.object(dcc, 'HTTP_CACHE_NAME', str(root / 'http_cache')),
+            mock.patch.object(dcc.yf, 'Ticker'),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        dcc.yf.Ticker.return_value.history.return_value = _history()
+        self.collector = dcc.FinancialDataCollector()
+        self.addCleanup(self.collector.close)
+        self.addCleanup(self.tmpdir.cleanup)
+
+    @unittest.skipUnless(dcc.PARQUET_AVAILABLE, "pyarrow not installed")
+    def test_second_call_is_served_from_cache(self):
+        first = self.collector.get_price_data_yfinance('AAA', '2y')
+        second = self.collector.get_price_data_yfinance('AAA', '2y')
+
+        self.assertEqual(dcc.yf.Ticker.call_count, 1)
+        pd.testing.assert_frame_equal(first, second)
+        self.assertEqual(list(dcc.PRICE_CACHE_DIR.glob('*.tmp')), [])
+
+    @unittest.skipUnless(dcc.PARQUET_AVAILABLE, "pyarrow not installed")
+    def test_corrupt_cache_entry_is_refetched(self):
+        cache_path = dcc._price_cache_path('AAA', '2y')
+        cache_path.parent.mkdir()
+        cache_path.write_bytes(b'PAR1 truncated')
+
+        hist = self.collector.get_price_data_yfinance('AAA', '2y')
+
+        self.assertEqual(len(hist), 5)
+        self.assertEqual(dcc.yf.Ticker.call_count, 1)
+        pd.testing.assert_frame_equal(pd.read_parquet(cache_path), hist)
+
+    @unittest.skipUnless(dcc.PARQUET_AVAILABLE, "pyarrow not installed")
+    def test_cache_write_failure_keeps_download(self):
+        with mock.patch.object(pd.DataFrame, 'to_parquet', side_effect=OSError("disk full")):
+            hist = self.collector.get_price_data_yfinance('AAA', '2y')
+
+        self.assertIsNotNone(hist)
+        self.assertEqual(len(hist), 5)
+        self.assertEqual(list(dcc.PRICE_CACHE_DIR.iterdir()), [])
+
+    @unittest.skipUnless(dcc.PARQUET_AVAILABLE, "pyarrow not installed")
+    def test_batch_downloads_only_cache_misses(self):
+        self.collector.get_price_data_yfinance('AAA', '2y')
+
+        with mock.patch.object(dcc.yf, 'download') as download:
+            download.return_value = pd.concat({'BBB': _history(), 'CCC': _history(3)}, axis=1)
+            first = self.collector.get_price_data_yfinance_batch(['AAA', 'BBB', 'CCC', 'DDD'], '2y')
+            second = self.collector.get_price_data_yfinance_batch(['AAA', 'BBB', 'CCC'], '2y')
+
+        self.assertEqual(download.call_count, 1)
+        self.assertEqual(download.call_args.args[0], ['BBB', 'CCC', 'DDD'])
+        self.assertEqual({symbol: len(hist) for symbol, hist in second.items()}, {'AAA': 5, 'BBB': 5, 'CCC': 3})
+        self.assertIsNone(first['DDD'])
+        self.assertEqual(list(first['CCC']['symbol'].unique()), ['CCC'])
+
+
+class InfoCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        root = Path(self.tmpdir.name)
+        patches = [
+            mock.patch.object(dcc, 'INFO_CACHE_DIR', root / 'info'),
+            mock.patch.object(dcc, 'HTTP_CACHE_NAME', str(root / 'http_cache')),
+            mock.patch.object(dcc.yf, 'Ticker'),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        dcc.yf.Ticker.return_value.info = {'symbol': 'AAA', 'longName': 'Triple A'}
+        self.collector = dcc.FinancialDataCollector()
+        self.addCleanup(self.collector.close)
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def test_second_call_is_served_from_cache(self):
+        self.collector.get_asset_info_yfinance('AAA')
+        info = self.collector.get_asset_info_yfinance('AAA')
+
+        self.assertEqual(info['longName'], 'Triple A')
+        self.assertEqual(dcc.yf.Ticker.call_count, 1)
+
+    def test_corrupt_cache_entry_is_refetched(self):
+        cache_path = dcc._daily_cache_path(dcc.INFO_CACHE_DIR, '.json', 'AAA')
+        cache_path.parent.mkdir()
+        cache_path.write_text('{"symbol": "AA')
+
+        info = self.collector.get_asset_info_yfinance('AAA')
+
+        self.assertEqual(info['longName'], 'Triple A')
+        self.assertEqual(dcc.yf.Ticker.call_count, 1)
+        self.assertEqual(dcc.json_loads(cache_path.read_bytes()), info)
+
+
+if __name__ == '__main__':
+    unittest.main()
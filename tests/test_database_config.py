@@ -0,0 +1,264 @@
+"""
+Tests for data_setup.components.database_config.FinancialDatabase
+"""
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from data_setup.components.database_config import WITHOUT_ROWID_KEYS, FinancialDatabase, _derive_daily_returns
+from data_setup.utils.kernels import NUMBA_MIN_SIZE
+
+SCHEMA_FILE = os.path.join(os.path.dirname(__file__), '..', 'database_and_schema', 'schema.sql')
+
+
+def _prices(symbol: str, n: int = 3) -> pd.DataFrame:
+    """Standardized daily_prices frame"""
+    close = [100.0 + i for i in range(n)]
+    return pd.DataFrame({
+        'symbol': symbol,
+        'date': pd.date_range('2024-01-02', periods=n, freq='B'),
+        'open_price': close, 'high_price': close, 'low_price': close, 'close_price': close,
+        'volume': 1000
+    })
+
+
+def _indicator(frequency: str) -> dict:
+    return {'indicator_name': 'Rate', 'indicator_code': 'RATE', 'date': '2024-01-01', 'value': 1.0,
+            'unit': 'Percent', 'frequency': frequency, 'source': 'FRED'}
+
+
+class DatabaseTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db = FinancialDatabase(os.path.join(self.tmpdir.name, 'test.db'))
+        self.db.create_database(SCHEMA_FILE)
+
+    def tearDown(self):
+        self.db.close()
+        self.tmpdir.cleanup()
+
+    def count(self, table: str) -> int:
+        return self.db.execute_scalar(f"SELECT COUNT(*) FROM {table}")
+
+
+class TransactionTest(DatabaseTestCase):
+
+    def test_commits_every_write_in_the_block(self):
+        with self.db.transaction():
+            self.db.insert_asset({'Symbol': 'AAA', 'Name': 'Triple A'})
+            self.db.insert_daily_prices(_prices('AAA'))
+
+        self.assertEqual(self.count('assets'), 1)
+        self.assertEqual(self.count('daily_prices'), 3)
+        self.assertFalse(self.db.connection.in_transaction)
+
+    def test_failed_insert_rolls_back_the_whole_block(self):
+        # Prices for an unknown symbol violate the daily_prices -> assets foreign key
+        with self.assertRaises(Exception):
+            with self.db.transaction():
+                self.db.insert_asset({'Symbol': 'AAA', 'Name': 'Triple A'})
+                self.db.insert_daily_prices(_prices('ZZZ'))
+
+        self.assertEqual(self.count('assets'), 0)
+        self.assertEqual(self.count('daily_prices'), 0)
+        self.assertFalse(self.db.connection.in_transaction)
+
+    def test_failed_nested_block_rolls_back_to_its_savepoint(self):
+        with self.db._transaction():
+            self.db.insert_asset({'Symbol': 'AAA', 'Name': 'Triple A'})
+            with self.assertRaises(RuntimeError):
+                with self.db._transaction():
+                    self.db.insert_asset({'Symbol': 'BBB', 'Name': 'Triple B'})
+                    raise RuntimeError("boom")
+            self.assertTrue(self.db.connection.in_transaction)
+            self.db.insert_asset({'Symbol': 'CCC', 'Name': 'Triple C'})
+
+        self.assertEqual([row[0] for row in self.db.execute_rows("SELECT symbol FROM assets ORDER BY symbol")],
+                         ['AAA', 'CCC'])
+        self.assertFalse(self.db.connection.in_transaction)
+
+    def test_nested_transactions_commit_once_with_the_outermost(self):
+        with self.db.transaction():
+            with self.db.transaction():
+                self.db.insert_asset({'Symbol': 'AAA', 'Name': 'Triple A'})
+            self.assertTrue(self.db.connection.in_transaction)
+            self.assertEqual(self.db._atomic, 1)
+
+        self.assertEqual(self.db._atomic, 0)
+        self.assertEqual(self.count('assets'), 1)
+
+    def test_failed_insert_outside_transaction_is_logged(self):
+        with self.assertLogs('data_setup.components.database_config', level='ERROR'):
+            self.db.insert_daily_prices(_prices('ZZZ'))
+
+        self.assertEqual(self.count('daily_prices'), 0)
+        self.assertFalse(self.db.connection.in_transaction)
+
+    def test_bulk_load_keeps_rows_of_other_inserts(self):
+        with self.db.bulk_load():
+            self.db.insert_asset({'Symbol': 'AAA', 'Name': 'Triple A'})
+            with self.assertLogs('data_setup.components.database_config', level='ERROR'):
+                # Foreign keys are off during bulk loads; the frequency CHECK still applies
+                self.db.insert_economic_indicators([_indicator('BAD')])
+            self.db.insert_economic_indicators([_indicator('Monthly')])
+
+        self.assertEqual(self.count('assets'), 1)
+        self.assertEqual(self.count('economic_indicators'), 1)
+
+
+class WithoutRowidRebuildTest(DatabaseTestCase):
+
+    def primary_key(self, table: str) -> tuple:
+        info = self.db.execute_rows(f"PRAGMA table_info({table})")
+        return tuple(column[1] for column in sorted((c for c in info if c[5]), key=lambda c: c[5]))
+
+    def test_time_series_tables_are_clustered_on_their_key(self):
+        for table, key in WITHOUT_ROWID_KEYS.items():
+            with self.subTest(table=table):
+                self.assertIn('WITHOUT ROWID', self.db.execute_scalar(
+                    "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)))
+                self.assertEqual(self.primary_key(table), key)
+
+        indexes = {row[1] for row in self.db.execute_rows("PRAGMA index_list(daily_prices)")}
+        self.assertIn('idx_daily_prices_date', indexes)
+        self.assertNotIn('idx_daily_prices_symbol_date', indexes)  # Covered by the primary key
+
+    def test_rebuild_of_without_rowid_table_is_a_no_op(self):
+        self.db.insert_asset({'Symbol': 'AAA', 'Name': 'Triple A'})
+        self.db.insert_daily_prices(_prices('AAA'))
+        create_sql = "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'daily_prices'"
+        before = self.db.execute_scalar(create_sql)
+
+        with self.db.transaction():
+            self.db._rebuild_without_rowid('daily_prices', WITHOUT_ROWID_KEYS['daily_prices'])
+
+        self.assertEqual(self.db.execute_scalar(create_sql), before)
+        self.assertEqual(self.count('daily_prices'), 3)
+        self.assertEqual(self.count('latest_asset_prices'), 1)  # Views still resolve the table
+
+    def test_legacy_rowid_table_is_rebuilt_with_its_rows(self):
+        self.db.connection.executescript("""
+            DROP TABLE daily_prices;
+            CREATE TABLE daily_prices (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                symbol VARCHAR(10) NOT NULL,
+                date DATE NOT NULL,
+                open_price DECIMAL(12,4),
+                high_price DECIMAL(12,4),
+                low_price DECIMAL(12,4),
+                close_price DECIMAL(12,4),
+                adjusted_close DECIMAL(12,4),
+                volume BIGINT,
+                UNIQUE(symbol, date)
+            );
+            CREATE INDEX idx_daily_prices_date ON daily_prices(date);
+        """)
+        self.db.insert_asset({'Symbol': 'AAA', 'Name': 'Triple A'})
+        self.db.insert_daily_prices(_prices('AAA'))
+
+        with self.db.transaction():
+            self.db._rebuild_without_rowid('daily_prices', WITHOUT_ROWID_KEYS['daily_prices'])
+
+        self.assertEqual(self.primary_key('daily_prices'), ('symbol', 'date'))
+        self.assertEqual(self.count('daily_prices'), 3)
+        self.assertEqual(self.count('latest_asset_prices'), 1)  # Views still resolve the table
+        self.assertIn('idx_daily_prices_date',
+                      {row[1] for row in self.db.execute_rows("PRAGMA index_list(daily_prices)")})
+
+
+class AssetUpsertTest(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.db.insert_asset({'Symbol': 'AAA', 'Name': 'Old Name', 'Sector': 'TECHNOLOGY'})
+        self.db.insert_daily_prices(_prices('AAA'))
+        self.db.connection.execute("UPDATE assets SET last_updated = '2000-01-01 00:00:00'")
+
+    def assert_updated_in_place(self):
+        name, sector, last_updated = self.db.execute_rows(
+            "SELECT name, sector, last_updated FROM assets WHERE symbol = 'AAA'")[0]
+        self.assertEqual(name, 'New Name')
+        self.assertIsNone(sector)  # Every column comes from the new row
+        self.assertGreater(last_updated, '2000-01-01 00:00:00')
+        # Updated in place, so the foreign keys don't cascade-delete the price history
+        self.assertEqual(self.count('daily_prices'), 3)
+
+    def test_insert_asset_updates_existing_row(self):
+        self.db.insert_asset({'Symbol': 'AAA', 'Name': 'New Name'})
+        self.assert_updated_in_place()
+
+    def test_insert_assets_batch_updates_existing_row(self):
+        self.db.insert_assets_batch([{'Symbol': 'AAA', 'Name': 'New Name'}, {'Symbol': 'BBB', 'Name': 'B'}])
+        self.assert_updated_in_place()
+        self.assertEqual(self.count('assets'), 2)
+
+    def test_upsert_assets_batch_updates_existing_row(self):
+        self.db.upsert_assets_batch([{'Symbol': 'AAA', 'Name': 'New Name'}, {'Symbol': 'BBB', 'Name': 'B'}])
+        self.assert_updated_in_place()
+        self.assertEqual(self.count('assets'), 2)
+        self.assertIsNone(self.db.execute_scalar(
+            "SELECT name FROM sqlite_temp_master WHERE name = '_assets_stage'"))
+
+
+class InsertDailyPricesManyTest(DatabaseTestCase):
+
+    def test_streams_every_frame_in_one_transaction(self):
+        for symbol in ('AAA', 'BBB'):
+            self.db.insert_asset({'Symbol': symbol, 'Name': symbol})
+        flushed = []
+
+        self.db.insert_daily_prices_many({
+            'AAA': _prices('AAA', 4),
+            'BBB': _prices('BBB', 2).drop(columns='symbol'),
+            'CCC': pd.DataFrame({'date': ['2024-01-02']})  # Missing price columns, skipped
+        }, callback=flushed.append)
+
+        self.assertEqual(self.count('daily_prices'), 6)
+        self.assertEqual(flushed, [6])
+        self.assertEqual(self.db.execute_scalar(
+            "SELECT date FROM daily_prices WHERE symbol = 'BBB' ORDER BY date LIMIT 1"), '2024-01-02')
+
+    def test_failure_rolls_back_all_symbols(self):
+        self.db.insert_asset({'Symbol': 'AAA', 'Name': 'AAA'})
+
+        with self.assertLogs('data_setup.components.database_config', level='ERROR'):
+            self.db.insert_daily_prices_many({'AAA': _prices('AAA'), 'ZZZ': _prices('ZZZ')})
+
+        self.assertEqual(self.count('daily_prices'), 0)
+
+
+class DeriveDailyReturnsTest(unittest.TestCase):
+
+    def test_fills_missing_returns_in_date_order(self):
+        records = [
+            {'symbol': 'IDX', 'date': '2024-01-03', 'index_value': 110.0},
+            {'symbol': 'IDX', 'date': '2024-01-02', 'index_value': 100.0},
+            {'symbol': 'IDX', 'date': None, 'index_value': 50.0},
+            {'symbol': 'IDX', 'date': '2024-01-04', 'index_value': 121.0, 'daily_return': 0.5},
+        ]
+
+        returns = _derive_daily_returns(records)
+
+        self.assertAlmostEqual(returns[0], 0.1)
+        self.assertIsNone(returns[1])
+        self.assertIsNone(returns[2])  # Undated rows can't be ordered
+        self.assertEqual(returns[3], 0.5)  # Supplied values are kept
+
+    def test_large_series_matches_small_series_path(self):
+        values = 100.0 + np.cumsum(np.random.default_rng(0).normal(size=NUMBA_MIN_SIZE + 1))
+        dates = pd.date_range('2000-01-03', periods=len(values), freq='D').date
+        records = [{'symbol': 'IDX', 'date': d, 'index_value': v} for d, v in zip(dates, values)]
+
+        returns = _derive_daily_returns(records)
+
+        self.assertIsNone(returns[0])
+        np.testing.assert_allclose(returns[1:], values[1:] / values[:-1] - 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+"""
+Tests for the numeric kernels in data_setup.utils.kernels, checked against pandas
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from data_setup.components import data_collection_config as dcc
+from data_setup.utils import kernels
+
+
+def _returns(n: int = 300, n_cols: int = 3, seed: int = 0) -> np.ndarray:
+    """(n, n_cols) daily returns with a few NaN gaps"""
+    values = np.random.default_rng(seed).normal(0.0, 0.01, size=(n, n_cols))
+    values[0] = np.nan
+    values[n // 6:n // 6 + 5, 1] = np.nan
+    values[n // 2, 2] = np.nan
+    return values
+
+
+class RollingStdTest(unittest.TestCase):
+
+    def test_matches_pandas_rolling_std(self):
+        values = _returns()
+        expected = pd.DataFrame(values).rolling(window=20).std().to_numpy()
+
+        np.testing.assert_allclose(kernels.rolling_std(values, 20), expected, rtol=1e-7, atol=1e-12)
+
+    def test_window_longer_than_series_is_all_nan(self):
+        self.assertTrue(np.isnan(kernels.rolling_std(_returns(10), 20)).all())
+
+    def test_constant_series_has_zero_std(self):
+        values = np.full((40, 1), 0.005)
+
+        std = kernels.rolling_std(values, 10)
+
+        self.assertTrue(np.isnan(std[:9]).all())
+        # Running sums leave only rounding noise where pandas reports exactly zero
+        np.testing.assert_allclose(std[9:], 0.0, atol=1e-9)
+
+    @unittest.skipUnless(kernels.NUMBA_AVAILABLE, "numba not installed")
+    def test_compiled_kernel_matches_python_fallback(self):
+        values = _returns()
+
+        np.testing.assert_allclose(kernels.rolling_std(values, 30), kernels.rolling_std.py_func(values, 30),
+                                   rtol=1e-9, atol=1e-15)
+
+
+class RealizedVolFromPricesTest(unittest.TestCase):
+
+    def setUp(self):
+        returns = np.random.default_rng(1).normal(0.0, 0.01, 400)
+        self.prices = 100.0 * np.cumprod(1.0 + returns)
+
+    def test_matches_pandas_pct_change_rolling_std(self):
+        expected = (pd.Series(self.prices).pct_change().rolling(window=30).std() * np.sqrt(252)).to_numpy()
+
+        np.testing.assert_allclose(kernels.realized_vol_from_prices(self.prices, 30), expected,
+                                   rtol=1e-7, atol=1e-12)
+
+    def test_missing_price_drops_the_windows_containing_it(self):
+        prices = self.prices.copy()
+        prices[200] = np.nan
+        expected = (pd.Series(prices).pct_change(fill_method=None).rolling(window=30).std()
+                    * np.sqrt(252)).to_numpy()
+
+        volatility = kernels.realized_vol_from_prices(prices, 30)
+
+        np.testing.assert_allclose(volatility, expected, rtol=1e-7, atol=1e-12)
+        self.assertTrue(np.isnan(volatility[200:231]).all())
+
+    def test_collector_volatility_matches_pandas(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        with mock.patch.object(dcc, 'HTTP_CACHE_NAME', os.path.join(tmpdir.name, 'http_cache')):
+            collector = dcc.FinancialDataCollector()
+        self.addCleanup(collector.close)
+
+        price_data = pd.DataFrame({
+            'symbol': 'AAA',
+            'date': pd.date_range('2023-01-02', periods=len(self.prices), freq='B'),
+            'close_price': self.prices
+        })
+        expected = price_data['close_price'].pct_change().rolling(window=30).std() * np.sqrt(252)
+
+        volatility = collector.calculate_realized_volatility(price_data, window=30)
+
+        self.assertEqual(len(volatility), expected.notna().sum())
+        self.assertEqual(volatility['date'].iloc[0], price_data['date'].iloc[30])
+        # Prices are read as float32 before the kernel runs
+        np.testing.assert_allclose(volatility['volatility_value'], expected.dropna(), rtol=1e-3)
+
+
+if __name__ == '__main__':
+    unittest.main()